@@ -7,7 +7,6 @@ giving users a single key to access all Heidi-managed models.
 
 from .key_manager import APIKeyManager, get_api_key_manager
 from .auth import HeidiAuthenticator, get_authenticator
-from .router import APIRouter, get_api_router
 
 __all__ = [
     "APIKeyManager",
@@ -17,3 +16,11 @@ __all__ = [
     "APIRouter",
     "get_api_router"
 ]
+
+
+def __getattr__(name):
+    # The router pulls in fastapi and the model host; load it on first use only.
+    if name in ("APIRouter", "get_api_router"):
+        from . import router
+        return getattr(router, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
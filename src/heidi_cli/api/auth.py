@@ -5,12 +5,17 @@ Handles authentication and authorization for Heidi API keys.
 """
 
 import time
-from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+import heapq
+import threading
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 from .key_manager import get_api_key_manager, APIKey
 from ..integrations.analytics import UsageAnalytics
 
+# Rate limit entries for keys idle this long (seconds) are dropped
+RATE_LIMIT_ENTRY_TTL = 300
+
 
 @dataclass
 class AuthResult:
@@ -21,13 +26,23 @@ class AuthResult:
     rate_limited: bool = False
 
 
+@dataclass(slots=True)
+class RateLimitEntry:
+    """Sliding-window request times for one API key."""
+    last_seen: float
+    requests: List[float] = field(default_factory=list)
+
+
 class HeidiAuthenticator:
     """Authenticates Heidi API keys and enforces rate limits."""
     
     def __init__(self):
         self.key_manager = get_api_key_manager()
         self.analytics = UsageAnalytics()
-        self._rate_limit_cache: Dict[str, Dict] = {}
+        self._rate_limit_cache: Dict[str, RateLimitEntry] = {}
+        self._lock = threading.Lock()
+        # (expiry, key_id) min-heap; entries are re-checked against last_seen when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
     
     def authenticate(self, api_key: str, request_info: Dict = None) -> AuthResult:
         """Authenticate an API key and check rate limits."""
@@ -59,52 +74,52 @@ class HeidiAuthenticator:
     
     def _is_rate_limited(self, api_key: APIKey) -> bool:
         """Check if the API key is rate limited."""
-        current_time = time.time()
+        current_time = time.monotonic()  # window math must not jump with the wall clock
         key_id = api_key.key_id
         
-        # Get or create rate limit entry
-        if key_id not in self._rate_limit_cache:
-            self._rate_limit_cache[key_id] = {
-                "requests": [],
-                "last_cleanup": current_time
-            }
-        
-        rate_info = self._rate_limit_cache[key_id]
-        
-        # Clean old requests (older than 1 minute)
-        cutoff_time = current_time - 60
-        rate_info["requests"] = [
-            req_time for req_time in rate_info["requests"] 
-            if req_time > cutoff_time
-        ]
-        
-        # Check rate limit
-        if len(rate_info["requests"]) >= api_key.rate_limit:
-            return True
-        
-        # Add current request
-        rate_info["requests"].append(current_time)
-        
-        # Cleanup old entries periodically
-        if current_time - rate_info["last_cleanup"] > 300:  # 5 minutes
-            self._cleanup_rate_limits()
-            rate_info["last_cleanup"] = current_time
+        # Concurrent requests share the cache; check-and-append must be atomic
+        with self._lock:
+            # Drop idle entries first so a recreated entry gets a fresh heap slot
+            self._cleanup_rate_limits(current_time)
+            
+            # Get or create rate limit entry
+            rate_info = self._rate_limit_cache.get(key_id)
+            if rate_info is None:
+                rate_info = self._rate_limit_cache[key_id] = RateLimitEntry(last_seen=current_time)
+                heapq.heappush(self._expiry_heap, (current_time + RATE_LIMIT_ENTRY_TTL, key_id))
+            rate_info.last_seen = current_time
+            
+            # Clean old requests (older than 1 minute)
+            cutoff_time = current_time - 60
+            rate_info.requests = [
+                req_time for req_time in rate_info.requests 
+                if req_time > cutoff_time
+            ]
+            
+            # Check rate limit
+            if len(rate_info.requests) >= api_key.rate_limit:
+                return True
+            
+            # Add current request
+            rate_info.requests.append(current_time)
         
         return False
     
-    def _cleanup_rate_limits(self):
-        """Clean up old rate limit entries."""
-        current_time = time.time()
-        cutoff_time = current_time - 300  # 5 minutes
-        
-        # Remove old entries
-        old_keys = [
-            key_id for key_id, info in self._rate_limit_cache.items()
-            if info["last_cleanup"] < cutoff_time
-        ]
-        
-        for key_id in old_keys:
-            del self._rate_limit_cache[key_id]
+    def _cleanup_rate_limits(self, current_time: float):
+        """Clean up old rate limit entries. Caller must hold self._lock."""
+        # Only entries whose deadline has passed are touched, so this is cheap per request
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= current_time:
+            _, key_id = heapq.heappop(heap)
+            info = self._rate_limit_cache.get(key_id)
+            if info is None:
+                continue
+            expiry = info.last_seen + RATE_LIMIT_ENTRY_TTL
+            if expiry <= current_time:
+                del self._rate_limit_cache[key_id]
+            else:
+                # Seen since it was queued; wait for its new deadline
+                heapq.heappush(heap, (expiry, key_id))
     
     def _record_auth_success(self, api_key: APIKey, request_info: Dict = None):
         """Record successful authentication for analytics."""
@@ -134,21 +149,24 @@ class HeidiAuthenticator:
     def get_rate_limit_info(self, api_key: APIKey) -> Dict:
         """Get rate limit information for an API key."""
         key_id = api_key.key_id
-        current_time = time.time()
+        current_time = time.monotonic()
+        reset_time = time.time() + 60
         
-        if key_id not in self._rate_limit_cache:
+        with self._lock:
+            rate_info = self._rate_limit_cache.get(key_id)
+            requests = list(rate_info.requests) if rate_info else None
+        
+        if requests is None:
             return {
                 "limit": api_key.rate_limit,
                 "remaining": api_key.rate_limit,
-                "reset_time": current_time + 60
+                "reset_time": reset_time
             }
         
-        rate_info = self._rate_limit_cache[key_id]
-        
         # Count requests in the last minute
         cutoff_time = current_time - 60
         recent_requests = [
-            req_time for req_time in rate_info["requests"]
+            req_time for req_time in requests
             if req_time > cutoff_time
         ]
         
@@ -156,7 +174,7 @@ class HeidiAuthenticator:
             "limit": api_key.rate_limit,
             "used": len(recent_requests),
             "remaining": max(0, api_key.rate_limit - len(recent_requests)),
-            "reset_time": current_time + 60
+            "reset_time": reset_time
         }
 
 
@@ -18,6 +18,9 @@ from dataclasses import dataclass, asdict
 from ..shared.config import ConfigLoader
 from ..runtime.db import db
 
+# Every generated key carries this prefix
+API_KEY_PREFIX = "heidik_"
+
 
 @dataclass
 class APIKey:
@@ -100,7 +103,7 @@ class APIKeyManager:
         
         # Generate unique key
         key_id = str(uuid.uuid4())
-        raw_key = f"heidik_{secrets.token_urlsafe(32)}"
+        raw_key = f"{API_KEY_PREFIX}{secrets.token_urlsafe(32)}"
         api_key = self._hash_api_key(raw_key)
         
         # Set expiration
@@ -158,6 +161,10 @@ class APIKeyManager:
     
     def validate_api_key(self, api_key: str) -> Optional[APIKey]:
         """Validate an API key and return the key object if valid."""
+        # Malformed keys can never match; skip the hash and the database round trip
+        if not api_key or not api_key.startswith(API_KEY_PREFIX):
+            return None
+
         hashed_key = self._hash_api_key(api_key)
         
         with db.get_connection() as conn:
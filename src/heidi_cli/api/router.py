@@ -44,7 +44,7 @@ class APIRouter:
         # This will be called after authentication
         # The actual authentication is handled by FastAPI middleware
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Determine model provider and route
@@ -69,8 +69,7 @@ class APIRouter:
                 )
             
             # Record usage analytics
-            end_time = time.time()
-            response_time_ms = (end_time - start_time) * 1000
+            response_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             self._record_usage(
                 model, messages, response, response_time_ms, True
@@ -80,8 +79,7 @@ class APIRouter:
             
         except Exception as e:
             # Record failed request
-            end_time = time.time()
-            response_time_ms = (end_time - start_time) * 1000
+            response_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             self._record_usage(
                 model, messages, {}, response_time_ms, False, str(e)
@@ -215,7 +215,7 @@ async def get_user_info(auth_result: AuthResult = Depends(authenticate_api_key))
 @app.middleware("http")
 async def add_headers_and_logging(request, call_next):
     """Add custom headers and log requests."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     # Add custom headers
     response = await call_next(request)
@@ -225,7 +225,7 @@ async def add_headers_and_logging(request, call_next):
     response.headers["X-Service"] = "Heidi API"
     
     # Log request time
-    process_time = time.time() - start_time
+    process_time = (time.perf_counter_ns() - start_ns) / 1e9
     response.headers["X-Process-Time"] = str(process_time)
     
     return response
@@ -5,7 +5,9 @@ Audit and compliance logging system for model hosting.
 from __future__ import annotations
 
 import json
+import atexit
 import hashlib
+import functools
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
@@ -14,10 +16,50 @@ from enum import Enum
 import sqlite3
 import logging
 import gzip
+import time
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("heidi.audit")
 
+# Buffered events are written in one transaction once this many queue up,
+# or after AUDIT_FLUSH_INTERVAL seconds, whichever comes first
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL = 0.5
+# Upper bound (seconds) on the wait between flush retries while the database is failing
+AUDIT_FLUSH_MAX_BACKOFF = 30.0
+# Past this many buffered events, log_event flushes inline; while the database keeps
+# failing, the oldest events beyond this cap are dropped so memory stays bounded
+AUDIT_MAX_PENDING = 10_000
+
+
+def _dumps(data: Any) -> str:
+    """Encode a details payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
+def _loads(text: str) -> Any:
+    """Decode a details payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+_INSERT_EVENT_SQL = """
+    INSERT OR REPLACE INTO audit_events (
+        event_id, timestamp, level, category, action, resource,
+        user_id, session_id, ip_address, user_agent, details,
+        model_id, tokens_processed, processing_time_ms,
+        status_code, error_message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 class AuditLevel(Enum):
     """Audit log levels."""
     INFO = "info"
@@ -57,12 +99,12 @@ class AuditEvent:
     def __post_init__(self):
         if self.event_id == "":
             self.event_id = hashlib.sha256(
-                f"{self.timestamp.isoformat()}{self.action}{self.resource}".encode()
+                f"{self.timestamp_iso}{self.action}{self.resource}".encode()
             ).hexdigest()[:16]
     
-    @property
+    @functools.cached_property
     def timestamp_iso(self) -> str:
-        """Get ISO format timestamp."""
+        """Get ISO format timestamp (formatted once per event)."""
         return self.timestamp.isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -124,9 +166,19 @@ class AuditLogger:
         
         self._init_database()
         self._lock = threading.Lock()
-        
-        # Start cleanup thread
+        # Rows waiting for the flush thread; guarded by _lock
+        self._pending: List[tuple] = []
+        self._flush_wakeup = threading.Condition(self._lock)
+        # Serializes flushes so batches reach the database in log order
+        self._flush_lock = threading.Lock()
+        # Inline flushes back off like the flush thread while the database is failing
+        self._inline_backoff = 0.0
+        self._inline_retry_at = 0.0
+        
+        # Start flush and cleanup threads
+        self._start_flush_thread()
         self._start_cleanup_thread()
+        atexit.register(self.flush)
     
     def _init_database(self):
         """Initialize audit database."""
@@ -218,10 +270,56 @@ class AuditLogger:
             error_message=error_message
         )
         
+        row = self._event_row(event)
         with self._lock:
-            self._save_event(event)
+            self._pending.append(row)
+            dropped = self._trim_pending()
+            pending = len(self._pending)
+            if pending >= AUDIT_BATCH_SIZE:
+                self._flush_wakeup.notify()
+        if dropped:
+            logger.warning(f"Audit buffer full; dropped {dropped} oldest events")
+        if pending >= AUDIT_MAX_PENDING and time.monotonic() >= self._inline_retry_at:
+            # The flush thread is behind or failing; make the caller wait for the write.
+            # The event is already queued, so a failure must not invite a retry
+            try:
+                self.flush()
+                self._inline_backoff = 0.0
+            except Exception as e:
+                logger.error(f"Audit inline flush error: {e}")
+                self._inline_backoff = min(
+                    max(self._inline_backoff * 2, AUDIT_FLUSH_INTERVAL), AUDIT_FLUSH_MAX_BACKOFF
+                )
+                self._inline_retry_at = time.monotonic() + self._inline_backoff
         
         return event.event_id
+
+    def _trim_pending(self) -> int:
+        """Drop the oldest buffered rows beyond AUDIT_MAX_PENDING; caller holds _lock."""
+        excess = len(self._pending) - AUDIT_MAX_PENDING
+        if excess <= 0:
+            return 0
+        del self._pending[:excess]
+        return excess
+
+    def flush(self):
+        """Write all buffered audit events to the database."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.executemany(_INSERT_EVENT_SQL, rows)
+            except Exception:
+                # Keep the batch for the next attempt, within the AUDIT_MAX_PENDING cap
+                with self._lock:
+                    self._pending[:0] = rows
+                    dropped = self._trim_pending()
+                if dropped:
+                    logger.warning(f"Audit buffer full; dropped {dropped} oldest events")
+                raise
     
     def log_interaction(self, user_id: str, session_id: str, model_id: str,
                        prompt: str, response: str, tokens: int, 
@@ -291,6 +389,7 @@ class AuditLogger:
                      level: Optional[AuditLevel] = None,
                      limit: int = 1000) -> List[AuditEvent]:
         """Search audit events with filters."""
+        self.flush()
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             
@@ -343,7 +442,7 @@ class AuditLogger:
                     session_id=row['session_id'],
                     ip_address=row['ip_address'],
                     user_agent=row['user_agent'],
-                    details=json.loads(row['details']) if row['details'] else {},
+                    details=_loads(row['details']) if row['details'] else {},
                     model_id=row['model_id'],
                     tokens_processed=row['tokens_processed'],
                     processing_time_ms=row['processing_time_ms'],
@@ -488,25 +587,17 @@ class AuditLogger:
         
         return summary
     
-    def _save_event(self, event: AuditEvent):
-        """Save audit event to database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO audit_events (
-                    event_id, timestamp, level, category, action, resource,
-                    user_id, session_id, ip_address, user_agent, details,
-                    model_id, tokens_processed, processing_time_ms,
-                    status_code, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.event_id, event.timestamp_iso, event.level.value,
-                event.category.value, event.action, event.resource,
-                event.user_id, event.session_id, event.ip_address,
-                event.user_agent, json.dumps(event.details),
-                event.model_id, event.tokens_processed, event.processing_time_ms,
-                event.status_code, event.error_message
-            ))
-            conn.commit()
+    @staticmethod
+    def _event_row(event: AuditEvent) -> tuple:
+        """Build the audit_events row for an event."""
+        return (
+            event.event_id, event.timestamp_iso, event.level.value,
+            event.category.value, event.action, event.resource,
+            event.user_id, event.session_id, event.ip_address,
+            event.user_agent, _dumps(event.details),
+            event.model_id, event.tokens_processed, event.processing_time_ms,
+            event.status_code, event.error_message
+        )
     
     def _save_report(self, report: ComplianceReport):
         """Save compliance report to database."""
@@ -613,6 +704,29 @@ class AuditLogger:
         
         return recommendations
     
+    def _start_flush_thread(self):
+        """Start background thread that writes buffered events in batches."""
+        def flush_pending():
+            backoff = 0.0
+            while True:
+                with self._lock:
+                    self._flush_wakeup.wait_for(
+                        lambda: len(self._pending) >= AUDIT_BATCH_SIZE,
+                        timeout=AUDIT_FLUSH_INTERVAL,
+                    )
+                try:
+                    self.flush()
+                    backoff = 0.0
+                except Exception as e:
+                    logger.error(f"Audit flush error: {e}")
+                    # A requeued full batch satisfies wait_for at once; back off
+                    # instead of spinning while the database stays unwritable
+                    backoff = min(max(backoff * 2, AUDIT_FLUSH_INTERVAL), AUDIT_FLUSH_MAX_BACKOFF)
+                    time.sleep(backoff)
+        
+        flush_thread = threading.Thread(target=flush_pending, daemon=True)
+        flush_thread.start()
+    
     def _start_cleanup_thread(self):
         """Start background cleanup thread."""
         def cleanup_old_records():
@@ -620,7 +734,6 @@ class AuditLogger:
                 try:
                     self._cleanup_old_records()
                     # Sleep for 24 hours
-                    import time
                     time.sleep(86400)
                 except Exception as e:
                     logger.error(f"Cleanup thread error: {e}")
@@ -633,6 +746,7 @@ class AuditLogger:
         """Clean up old audit records based on retention policy."""
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
         
+        self.flush()
         with sqlite3.connect(self.db_path) as conn:
             # Delete old audit events
             cursor = conn.execute("""
@@ -18,6 +18,9 @@ import threading
 
 logger = logging.getLogger("heidi.cache")
 
+# Seconds between background sweeps for expired memory-cache entries
+CACHE_SWEEP_INTERVAL = 60.0
+
 class CacheStrategy(Enum):
     """Cache eviction strategies."""
     LRU = "lru"
@@ -146,6 +149,38 @@ class MemoryCache(CacheBackend):
         self._access_order: List[str] = []  # For LRU
         self._lock = threading.RLock()
         self._stats = CacheStats()
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper: Optional[threading.Event] = None
+    
+    def start_sweeper(self, interval: float = CACHE_SWEEP_INTERVAL):
+        """Start a background thread that evicts expired entries."""
+        if self._sweeper is not None:
+            return
+        
+        # Each run gets its own event, so a restart never sees a stale stop signal
+        stop = threading.Event()
+        
+        def sweep():
+            while not stop.wait(interval):
+                try:
+                    with self._lock:
+                        self._evict_expired()
+                        self._update_stats()
+                except Exception as e:
+                    logger.error(f"Cache sweeper error: {e}")
+        
+        self._stop_sweeper = stop
+        self._sweeper = threading.Thread(target=sweep, daemon=True)
+        self._sweeper.start()
+    
+    def stop_sweeper(self):
+        """Stop the background sweeper thread and wait for it to exit."""
+        if self._sweeper is None:
+            return
+        self._stop_sweeper.set()
+        self._sweeper.join()
+        self._sweeper = None
+        self._stop_sweeper = None
     
     def get(self, key: str) -> Optional[Any]:
         """Get value by key."""
@@ -230,8 +265,9 @@ class MemoryCache(CacheBackend):
         """Get keys matching pattern."""
         with self._lock:
             import fnmatch
-            return [key for key in self._cache.keys() 
-                   if fnmatch.fnmatch(key, pattern)]
+            # Expired entries are skipped, not evicted; a read doesn't pay for cleanup
+            return [key for key, entry in self._cache.items()
+                   if not entry.is_expired and fnmatch.fnmatch(key, pattern)]
     
     def get_stats(self) -> CacheStats:
         """Get cache statistics."""
@@ -554,4 +590,6 @@ def get_cache_manager() -> CacheManager:
     global _cache_manager
     if _cache_manager is None:
         _cache_manager = CacheManager()
+        # Expired entries are reclaimed off the request path
+        _cache_manager.memory_cache.start_sweeper()
     return _cache_manager
@@ -10,6 +10,13 @@ from .launcher import start_daemon, stop_process, load_pids
 from .token_tracking.cli import register_tokens_app
 from .api.cli import register_api_app
 
+# Tag vocabularies for `heidi hf compare`; isdisjoint hashes each tag once
+COMPARE_CHAT_TAGS = frozenset({"chat", "instruct"})
+COMPARE_CODING_TAGS = frozenset({"coding", "code"})
+COMPARE_VISION_TAGS = frozenset({"vision", "image"})
+COMPARE_TOOL_TAGS = frozenset({"function-calling", "tool"})
+COMPARE_LANGUAGE_TAGS = frozenset({"english", "chinese", "french", "german", "spanish"})
+
 console = Console()
 app = typer.Typer(
     add_completion=False,
@@ -1097,13 +1104,13 @@ def hf_compare(model_ids: List[str] = typer.Argument(..., help="Model IDs to com
         for model in models_info:
             caps = []
             tags = model.get("tags", [])
-            if any(tag in tags for tag in ["chat", "instruct"]):
+            if not COMPARE_CHAT_TAGS.isdisjoint(tags):
                 caps.append("💬")
-            if any(tag in tags for tag in ["coding", "code"]):
+            if not COMPARE_CODING_TAGS.isdisjoint(tags):
                 caps.append("💻")
-            if any(tag in tags for tag in ["vision", "image"]):
+            if not COMPARE_VISION_TAGS.isdisjoint(tags):
                 caps.append("👁️")
-            if any(tag in tags for tag in ["function-calling", "tool"]):
+            if not COMPARE_TOOL_TAGS.isdisjoint(tags):
                 caps.append("🔧")
             capabilities.append(" ".join(caps) if caps else "💬")
 
@@ -1125,9 +1132,7 @@ def hf_compare(model_ids: List[str] = typer.Argument(..., help="Model IDs to com
         languages = []
         for model in models_info:
             tags = model.get("tags", [])
-            langs = [
-                tag for tag in tags if tag in ["english", "chinese", "french", "german", "spanish"]
-            ]
+            langs = [tag for tag in tags if tag in COMPARE_LANGUAGE_TAGS]
             languages.append(", ".join(langs) if langs else "English")
         table.add_row("Languages", *languages)
 
@@ -1162,7 +1167,7 @@ def hf_compare(model_ids: List[str] = typer.Argument(..., help="Model IDs to com
 
         # Best for coding
         coding_models = [
-            m for m in models_info if any(tag in m.get("tags", []) for tag in ["coding", "code"])
+            m for m in models_info if not COMPARE_CODING_TAGS.isdisjoint(m.get("tags", []))
         ]
         if coding_models:
             console.print(f"• Best for Coding: {', '.join([m.get('id') for m in coding_models])}")
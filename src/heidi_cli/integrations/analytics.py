@@ -60,6 +60,8 @@ class UsageAnalytics:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._lock = threading.Lock()
+        # Writer connection kept open across record_request calls; guarded by _lock
+        self._write_conn: Optional[sqlite3.Connection] = None
         self._init_database()
 
     def _init_database(self):
@@ -103,6 +105,19 @@ class UsageAnalytics:
                 ON model_usage(timestamp)
             """)
 
+    def _get_write_conn(self) -> sqlite3.Connection:
+        """Return the shared writer connection, opening it on first use."""
+        if self._write_conn is None:
+            self._write_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._write_conn
+
+    def close(self):
+        """Close the shared writer connection."""
+        with self._lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+
     def record_request(
         self,
         model_id: str,
@@ -115,7 +130,7 @@ class UsageAnalytics:
         """Record a model request."""
         with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._get_write_conn() as conn:
                     # Record individual request
                     conn.execute(
                         """
@@ -408,7 +423,7 @@ def get_analytics() -> UsageAnalytics:
 
         data_root = os.environ.get("HEIDI_ANALYTICS_PATH")
         if data_root:
-            _analytics_instance = UsageAnalytics(data_root=Path(data_root))
+            _analytics_instance = UsageAnalytics(data_root=Path(data_root).expanduser())
         else:
             _analytics_instance = UsageAnalytics()
     return _analytics_instance
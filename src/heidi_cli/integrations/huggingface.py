@@ -22,6 +22,20 @@ except ImportError:
 
 logger = logging.getLogger("heidi.huggingface")
 
+# Tag vocabularies for classifying hub metadata; frozensets make each tag check O(1)
+CHAT_TAGS = frozenset({"chat", "instruct", "chatglm"})
+CODING_TAGS = frozenset({"coding", "code", "python", "javascript"})
+INFO_SIZE_TAGS = frozenset({"7b", "13b", "70b", "1.8b", "3b", "30b"})
+CONFIG_SIZE_TAGS = INFO_SIZE_TAGS | {"1b", "6b"}
+INFO_LANGUAGE_TAGS = frozenset({"english", "chinese", "french", "german", "spanish"})
+CONFIG_LANGUAGE_TAGS = INFO_LANGUAGE_TAGS | {
+    "italian",
+    "portuguese",
+    "russian",
+    "japanese",
+    "korean",
+}
+
 
 class HuggingFaceIntegration:
     """Integration with HuggingFace Hub for model discovery and download."""
@@ -37,7 +51,7 @@ class HuggingFaceIntegration:
 
         heidi_home = os.environ.get("HEIDI_HOME")
         if heidi_home:
-            self.cache_dir = Path(heidi_home) / "models" / "huggingface"
+            self.cache_dir = Path(heidi_home).expanduser() / "models" / "huggingface"
         else:
             self.cache_dir = Path.home() / ".heidi" / "models" / "huggingface"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -150,18 +164,18 @@ class HuggingFaceIntegration:
             info["languages"] = []
 
             for tag in info["tags"]:
-                if tag in ["chat", "instruct", "chatglm"]:
+                if tag in CHAT_TAGS:
                     info["capabilities"].append("chat")
-                if tag in ["coding", "code", "python", "javascript"]:
+                if tag in CODING_TAGS:
                     info["capabilities"].append("coding")
                 if tag.startswith("context-length-"):
                     try:
                         info["context_length"] = int(tag.split("-")[-1])
                     except (ValueError, IndexError):
                         pass
-                if tag in ["7b", "13b", "70b", "1.8b", "3b", "30b"]:
+                if tag in INFO_SIZE_TAGS:
                     info["model_type"] = tag
-                if tag in ["english", "chinese", "french", "german", "spanish"]:
+                if tag in INFO_LANGUAGE_TAGS:
                     info["languages"].append(tag)
 
             # Extract context length from config if available
@@ -390,27 +404,15 @@ class HuggingFaceIntegration:
             model_type = None
             tags = model_info.get("tags", [])
             for tag in tags:
-                if tag in ["7b", "13b", "70b", "1.8b", "3b", "30b", "1b", "6b"]:
+                if tag in CONFIG_SIZE_TAGS:
                     model_type = tag
                     break
             config["model_type"] = model_type
 
             # Extract languages
             languages = []
-            language_tags = [
-                "english",
-                "chinese",
-                "french",
-                "german",
-                "spanish",
-                "italian",
-                "portuguese",
-                "russian",
-                "japanese",
-                "korean",
-            ]
             for tag in tags:
-                if tag in language_tags:
+                if tag in CONFIG_LANGUAGE_TAGS:
                     languages.append(tag)
             config["languages"] = languages
 
@@ -487,8 +489,7 @@ class HuggingFaceIntegration:
                 metadata_file = model_dir / "heidi_metadata.json"
                 if metadata_file.exists():
                     try:
-                        with open(metadata_file, "r") as f:
-                            metadata = json.load(f)
+                        metadata = json.loads(metadata_file.read_bytes())
                         local_models.append(metadata)
                     except (json.JSONDecodeError, Exception) as e:
                         logger.warning(f"Error reading metadata for {model_dir.name}: {e}")
@@ -517,8 +518,7 @@ class HuggingFaceIntegration:
 
         if metadata_file.exists():
             try:
-                with open(metadata_file, "r") as f:
-                    return json.load(f)
+                return json.loads(metadata_file.read_bytes())
             except Exception as e:
                 logger.error(f"Error reading metadata for {model_id}: {e}")
 
@@ -14,6 +14,10 @@ from .shared.config import ConfigLoader
 
 console = Console()
 
+# SIGTERM grace period before SIGKILL, and how often to check for exit meanwhile
+STOP_GRACE_SECONDS = 1.0
+STOP_POLL_INTERVAL = 0.05
+
 def get_pids_file() -> Path:
     """Get the PID file path from suite data root."""
     config = ConfigLoader.load()
@@ -56,10 +60,15 @@ def stop_process(name: str) -> bool:
     
     try:
         os.kill(pid, signal.SIGTERM)
-        time.sleep(1)
+        # Poll for exit instead of always sleeping the full grace period
+        deadline = time.monotonic() + STOP_GRACE_SECONDS
         try:
-            os.kill(pid, 0)
-            os.kill(pid, signal.SIGKILL)
+            while True:
+                os.kill(pid, 0)
+                if time.monotonic() >= deadline:
+                    os.kill(pid, signal.SIGKILL)
+                    break
+                time.sleep(STOP_POLL_INTERVAL)
         except OSError:
             pass
         remove_pid(name)
@@ -75,17 +84,19 @@ def start_daemon(name: str, cmd: list[str], log_name: str) -> int:
     log_dir.mkdir(parents=True, exist_ok=True)
     
     log_file = log_dir / log_name
-    log_fd = open(log_file, "w")
     
     env = os.environ.copy()
     env["PYTHONPATH"] = os.pathsep.join(sys.path)
 
-    process = subprocess.Popen(
-        cmd,
-        stdout=log_fd,
-        stderr=subprocess.STDOUT,
-        start_new_session=True,
-        env=env,
-    )
+    # The child gets its own copy of the log fd; ours is closed once it has spawned.
+    with open(log_file, "w") as log_fd:
+        process = subprocess.Popen(
+            cmd,
+            stdout=log_fd,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            close_fds=True,
+            env=env,
+        )
     add_pid(name, process.pid)
     return process.pid
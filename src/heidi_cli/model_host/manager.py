@@ -16,8 +16,24 @@ from .metadata import metadata_manager, ModelStatus, ModelMetrics, ModelProvider
 from ..integrations.analytics import get_analytics
 from ..token_tracking.models import get_token_database, TokenUsage
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("heidi.model_host")
 
+# Stand-in for the delta content when pre-serializing a streamed chunk envelope
+_CONTENT_SLOT = "__heidi_stream_content__"
+
+
+def _dumps_chunk(chunk: Any) -> str:
+    """Encode one streamed completion chunk, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(chunk).decode()
+    return json.dumps(chunk, separators=(",", ":"))
+
+
 # Lazy imports for transformers
 torch = None
 transformers = None
@@ -322,7 +338,7 @@ class ModelManager:
         self, model_id: str, messages: List[Dict[str, str]], **kwargs
     ) -> Dict[str, Any]:
         """Route request to the correct model and get response with metrics."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         session_id = kwargs.pop("session_id", str(uuid.uuid4()))
         user_id = kwargs.pop("user_id", "default")
         request_start_time = kwargs.pop("request_start_time", None)
@@ -362,7 +378,7 @@ class ModelManager:
                 response = await self._get_local_response(model_id, messages, **kwargs)
 
             # Update metrics
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
             self.total_response_time += response_time
             self._update_model_metrics(model_id, response_time, success=True)
 
@@ -383,7 +399,7 @@ class ModelManager:
         except Exception as e:
             # Update error metrics
             self.error_count += 1
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
             self._update_model_metrics(model_id, response_time, success=False)
 
             # Record error analytics
@@ -524,11 +540,11 @@ class ModelManager:
                     {"index": 0, "delta": {"content": response_text}, "finish_reason": None}
                 ],
             }
-            yield json.dumps(chunk)
+            yield _dumps_chunk(chunk)
 
             # Final chunk
             chunk["choices"][0]["finish_reason"] = "stop"
-            yield json.dumps(chunk)
+            yield _dumps_chunk(chunk)
             return
 
         # For local models, we'll simulate streaming by generating full response first
@@ -536,28 +552,27 @@ class ModelManager:
         full_response = await self.get_response(model_id, messages, **kwargs)
         content = full_response["choices"][0]["message"]["content"]
 
+        chunk = {
+            "id": f"chatcmpl-{model_id}",
+            "object": "chat.completion.chunk",
+            "created": 1677610602,
+            "model": model_id,
+            "choices": [
+                {"index": 0, "delta": {"content": _CONTENT_SLOT}, "finish_reason": None}
+            ],
+        }
+        # Word chunks differ only in content; serialize the envelope once and splice it in
+        head, _, tail = _dumps_chunk(chunk).rpartition(_dumps_chunk(_CONTENT_SLOT))
+
         # Split content into words for streaming effect
         words = content.split()
         for i, word in enumerate(words):
-            chunk = {
-                "id": f"chatcmpl-{model_id}",
-                "object": "chat.completion.chunk",
-                "created": 1677610602,
-                "model": model_id,
-                "choices": [
-                    {
-                        "index": 0,
-                        "delta": {"content": word + (" " if i < len(words) - 1 else "")},
-                        "finish_reason": None,
-                    }
-                ],
-            }
-            yield json.dumps(chunk)
+            yield head + _dumps_chunk(word + (" " if i < len(words) - 1 else "")) + tail
 
         # Final chunk
         chunk["choices"][0]["delta"] = {}
         chunk["choices"][0]["finish_reason"] = "stop"
-        yield json.dumps(chunk)
+        yield _dumps_chunk(chunk)
 
     async def _get_local_response(
         self, model_id: str, messages: List[Dict[str, str]], **kwargs
@@ -710,8 +725,8 @@ class ModelManager:
                 avg_response_time = self.total_response_time / total_requests
                 success_rate = (total_requests - self.error_count) / total_requests
 
-                # Update metrics
-                metrics = ModelMetrics(
+                # Every field is computed here, so skip pydantic validation on this per-request path
+                metrics = ModelMetrics.model_construct(
                     avg_latency_ms=avg_response_time * 1000,
                     requests_per_minute=total_requests / ((time.time() - self.start_time) / 60),
                     success_rate=success_rate,
@@ -874,7 +889,8 @@ class ModelManager:
             # Save to database
             self.token_db.record_usage(usage)
 
-            logger.debug(f"Recorded token usage: {total_tokens} tokens for {model_id}")
+            # Runs once per request; %-args defer formatting until DEBUG is on
+            logger.debug("Recorded token usage: %s tokens for %s", total_tokens, model_id)
 
         except Exception as e:
             logger.error(f"Failed to record token usage: {e}")
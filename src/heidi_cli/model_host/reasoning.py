@@ -17,7 +17,8 @@ class ReasoningLevel(Enum):
     VERBOSE = "verbose"
 
 
-@dataclass
+# Several steps are built per request; slots keep each one small
+@dataclass(slots=True)
 class ReasoningStep:
     thought: str
     action: Optional[str] = None
@@ -25,7 +26,7 @@ class ReasoningStep:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningTrace:
     steps: List[ReasoningStep] = field(default_factory=list)
     total_thinking_time_ms: float = 0.0
@@ -69,7 +70,7 @@ class ReasoningEngine:
         if not self.enabled or level == ReasoningLevel.NONE:
             return trace
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         if level == ReasoningLevel.BRIEF:
             trace.add_step(
@@ -133,7 +134,7 @@ class ReasoningEngine:
                         observation=f"Quality score: {self._assess_quality(model_response)}",
                     )
 
-        trace.total_thinking_time_ms = (time.time() - start_time) * 1000
+        trace.total_thinking_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         return trace
 
     def _classify_request(self, prompt: str) -> str:
@@ -22,6 +22,12 @@ logger = logging.getLogger("heidi.model_host")
 
 app = FastAPI(title="Heidi Local Model Host")
 
+# The getters hand back import-time singletons; bind them once instead of per request
+tool_registry = get_tool_registry()
+structured_gen = get_structured_generator()
+reasoning_engine = get_reasoning_engine()
+perf = get_performance_optimizer()
+
 
 class ChatMessage(BaseModel):
     role: str
@@ -352,7 +358,6 @@ async def stream_chat_completion(request: ChatCompletionRequest) -> AsyncGenerat
 @app.get("/v1/tools")
 async def list_tools():
     """List available tools for function calling."""
-    tool_registry = get_tool_registry()
     return {"object": "list", "data": tool_registry.list_tools()}
 
 
@@ -365,7 +370,6 @@ async def call_tools(request: Request):
     if not tool_calls:
         raise HTTPException(status_code=400, detail="No tool calls provided")
 
-    tool_registry = get_tool_registry()
     results = []
 
     for tc in tool_calls:
@@ -395,10 +399,6 @@ async def call_tools(request: Request):
 @app.post("/v1/chat/completions/structured")
 async def structured_output(request: StructuredOutputRequest):
     """Generate structured JSON output matching a schema."""
-    structured_gen = get_structured_generator()
-    reasoning_engine = get_reasoning_engine()
-    perf = get_performance_optimizer()
-
     start_time = time.time()
 
     prompt = structured_gen.generate_json_prompt(request.schema, request.messages[-1].content)
@@ -423,10 +423,11 @@ async def structured_output(request: StructuredOutputRequest):
             prompt=prompt, level=ReasoningLevel.BRIEF, model_response=raw_content
         )
 
+        finished = time.time()
         result = {
             "id": f"chatcmpl-struct-{uuid.uuid4().hex[:8]}",
             "object": "chat.completion",
-            "created": int(datetime.utcnow().timestamp()),
+            "created": int(finished),
             "model": request.model,
             "structured_output": parsed,
             "reasoning": reasoning_trace.to_dict(),
@@ -434,7 +435,7 @@ async def structured_output(request: StructuredOutputRequest):
             "metadata": {
                 "format": "json",
                 "schema_validated": parsed.get("validated", False),
-                "latency_ms": (time.time() - start_time) * 1000,
+                "latency_ms": (finished - start_time) * 1000,
             },
         }
 
@@ -448,9 +449,6 @@ async def structured_output(request: StructuredOutputRequest):
 @app.post("/v1/chat/completions/with-reasoning")
 async def chat_with_reasoning(request: ChatCompletionRequest):
     """Chat completion with reasoning traces."""
-    reasoning_engine = get_reasoning_engine()
-    perf = get_performance_optimizer()
-
     reasoning_level = {
         "none": ReasoningLevel.NONE,
         "low": ReasoningLevel.BRIEF,
@@ -458,7 +456,7 @@ async def chat_with_reasoning(request: ChatCompletionRequest):
         "high": ReasoningLevel.VERBOSE,
     }.get(request.reasoning_effort or "low", ReasoningLevel.BRIEF)
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
         response = await manager.get_response(
@@ -481,7 +479,7 @@ async def chat_with_reasoning(request: ChatCompletionRequest):
             "reasoning": reasoning_trace.to_dict(),
             "metadata": {
                 "reasoning_effort": request.reasoning_effort,
-                "latency_ms": (time.time() - start_time) * 1000,
+                "latency_ms": (time.perf_counter_ns() - start_ns) / 1_000_000,
                 "thinking_time_ms": reasoning_trace.total_thinking_time_ms,
             },
         }
@@ -504,16 +502,12 @@ async def chat_with_reasoning(request: ChatCompletionRequest):
 @app.get("/v1/performance/stats")
 async def performance_stats():
     """Get performance statistics."""
-    perf = get_performance_optimizer()
     return perf.get_stats()
 
 
 @app.get("/health/extended")
 async def extended_health():
     """Enhanced health check with performance metrics."""
-    perf = get_performance_optimizer()
-    tool_registry = get_tool_registry()
-
     return {
         "status": "healthy",
         "version": "0.1.1",
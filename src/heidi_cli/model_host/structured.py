@@ -10,6 +10,12 @@ import logging
 
 logger = logging.getLogger("heidi.structured")
 
+# Compiled once at import; parse paths run per response
+JSON_FENCE = "```json"
+JSON_FENCE_PATTERN = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+JSON_OBJECT_PATTERN = re.compile(r"\{[^{}]*\}")
+XML_ELEMENT_PATTERN = re.compile(r"<(\w+)>(.*?)</\1>")
+
 
 class OutputFormat(Enum):
     JSON = "json"
@@ -27,8 +33,8 @@ class ResponseFormat:
 
 class StructuredOutputGenerator:
     def __init__(self):
-        self.json_pattern = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
-        self.json_object_pattern = re.compile(r"\{[^{}]*\}")
+        self.json_pattern = JSON_FENCE_PATTERN
+        self.json_object_pattern = JSON_OBJECT_PATTERN
 
     def parse_json_response(
         self, text: str, schema: Optional[Dict[str, Any]] = None
@@ -36,10 +42,12 @@ class StructuredOutputGenerator:
         try:
             text = text.strip()
 
-            if text.startswith("```json"):
-                match = self.json_pattern.search(text)
-                if match:
-                    text = match.group(1)
+            if text.startswith(JSON_FENCE):
+                # Same result as JSON_FENCE_PATTERN, but a plain find stays linear
+                # when the closing fence is missing
+                end = text.find("```", len(JSON_FENCE))
+                if end != -1:
+                    text = text[len(JSON_FENCE):end].strip()
             elif text.startswith("```"):
                 text = text.split("```")[1]
                 if text.startswith("json"):
@@ -136,8 +144,7 @@ Respond ONLY with JSON. No additional text."""
     def _parse_xml(self, text: str) -> Dict[str, Any]:
         try:
             data = {}
-            pattern = re.compile(r"<(\w+)>(.*?)</\1>")
-            for match in pattern.finditer(text):
+            for match in XML_ELEMENT_PATTERN.finditer(text):
                 key, value = match.groups()
                 data[key] = value.strip()
             return {"success": True, "data": data}
@@ -9,6 +9,9 @@ from enum import Enum
 
 logger = logging.getLogger("heidi.tools")
 
+# Characters a calculator expression may contain
+CALCULATOR_CHARS = frozenset("0123456789+-*/.() ")
+
 
 class ToolCallStatus(Enum):
     PENDING = "pending"
@@ -25,7 +28,8 @@ class ToolDefinition:
     handler: Optional[Callable] = None
 
 
-@dataclass
+# One per tool invocation; slots keep the per-call instance small
+@dataclass(slots=True)
 class ToolCall:
     id: str
     name: str
@@ -185,8 +189,7 @@ class ToolRegistry:
     @staticmethod
     def _calculate(expression: str) -> Dict[str, Any]:
         try:
-            allowed_chars = set("0123456789+-*/.() ")
-            if not all(c in allowed_chars for c in expression):
+            if not CALCULATOR_CHARS.issuperset(expression):
                 return {"error": "Invalid characters in expression"}
             import ast
 
@@ -384,10 +384,9 @@ class MetricsCollector:
     def get_alerts(self, enabled_only: bool = True) -> List[Alert]:
         """Get alerts."""
         with self._lock:
-            alerts = list(self._alerts.values())
             if enabled_only:
-                alerts = [a for a in alerts if a.enabled]
-            return alerts
+                return [a for a in self._alerts.values() if a.enabled]
+            return list(self._alerts.values())
     
     def check_alerts(self):
         """Check all alerts and trigger if needed."""
@@ -508,7 +507,7 @@ class MetricsCollector:
             "application": {
                 "metrics_count": len(self._metrics),
                 "alerts_count": len(self._alerts),
-                "enabled_alerts": len([a for a in self._alerts.values() if a.enabled])
+                "enabled_alerts": sum(1 for a in self._alerts.values() if a.enabled)
             }
         }
         
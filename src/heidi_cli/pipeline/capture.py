@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import re
 import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from ..shared.config import ConfigLoader
 
+# One anchored scan rejects separators, leading dots, ".." and over-long run ids
+RUN_ID_PATTERN = re.compile(r"(?!\.)(?!.*\.\.)[A-Za-z0-9._-]{1,64}")
+
 class CaptureEngine:
     """Captures raw run data for offline curation."""
 
@@ -14,12 +19,15 @@ class CaptureEngine:
         self.config = ConfigLoader.load()
         self.raw_root = self.config.state_dirs["datasets_raw"]
 
-    def create_run_folder(self, run_id: Optional[str] = None) -> Path:
+    def create_run_folder(self, run_id: Optional[str] = None, now: Optional[datetime] = None) -> Path:
         """Create a dated folder for a new run."""
         if not run_id:
             run_id = str(uuid.uuid4())
+        elif not RUN_ID_PATTERN.fullmatch(run_id):
+            raise ValueError(f"Invalid run_id: {run_id!r}")
         
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        # date.isoformat() yields the same %Y-%m-%d name without strftime's format parsing
+        date_str = (now or datetime.now()).date().isoformat()
         run_folder = self.raw_root / date_str / run_id
         run_folder.mkdir(parents=True, exist_ok=True)
         return run_folder
@@ -27,20 +35,27 @@ class CaptureEngine:
     async def capture_run(self, task: str, messages: List[Dict[str, str]], response: Dict[str, Any], meta: Optional[Dict[str, Any]] = None):
         """Save raw run data and metadata."""
         run_id = str(uuid.uuid4())
-        run_folder = self.create_run_folder(run_id)
-        
+        # One clock read for both the timestamp and the dated folder
+        now = datetime.now()
+
         data = {
             "run_id": run_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "task": task,
             "messages": messages,
             "response": response,
             "metadata": meta or {}
         }
         
+        # Serialization and disk I/O block, so keep them off the event loop
+        await asyncio.to_thread(self._write_run, run_id, data, now)
+
+        return run_id
+
+    def _write_run(self, run_id: str, data: Dict[str, Any], now: datetime) -> None:
+        """Create the run folder and write its run.json."""
+        run_folder = self.create_run_folder(run_id, now)
         with open(run_folder / "run.json", "w") as f:
             json.dump(data, f, indent=2)
-            
-        return run_id
 
 capture_engine = CaptureEngine()
@@ -1,29 +1,94 @@
 from __future__ import annotations
 
+import os
 import re
 import json
+import functools
+from pathlib import Path
 from datetime import datetime
 from typing import Any, Optional
 from ..shared.config import ConfigLoader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def _load_json(raw: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json_line(entry: Any) -> bytes:
+    """Encode one JSONL record, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+# Common secret patterns (API keys, tokens, etc.)
+REDACTION_PATTERNS = (
+    re.compile(r"sk-[a-zA-Z0-9]{32,}", re.I),           # OpenAI
+    re.compile(r"gh[oprs]_[a-zA-Z0-9]{36,}", re.I),     # GitHub
+    re.compile(r"(?:password|secret|key|token)\s*[=:]\s*['\"]?([a-zA-Z0-9_\-]{8,})['\"]?", re.I),
+)
+
+# Every pattern shares one replacement, so a single alternation redacts in one scan;
+# with google-re2 installed that scan is linear-time on adversarial run content
+_REDACTION_RE = (re2 or re).compile(
+    "(?i)" + "|".join(f"(?:{p.pattern})" for p in REDACTION_PATTERNS)
+)
+
+# Dict keys whose string values are redacted outright
+SECRET_KEY_HINTS = ("password", "secret", "key", "token")
+
+# Longer strings are rarely repeated verbatim and would bloat the redaction cache
+REDACTION_CACHE_MAX_LEN = 4096
+
+# Literal substrings at least one of which every redaction pattern requires (lowercased)
+REDACTION_TRIGGERS = ("sk-", "gho_", "ghp_", "ghr_", "ghs_", "password", "secret", "key", "token")
+_REDACTION_TRIGGERS_BYTES = tuple(t.encode() for t in REDACTION_TRIGGERS)
+
+
+def _may_need_redaction(raw: bytes) -> bool:
+    """Return False only if a raw run document provably contains nothing to redact."""
+    # Every pattern and key hint contains a trigger; escapes and non-ASCII text
+    # (which can case-fold into ASCII) always take the full walk
+    if not raw.isascii() or b"\\u" in raw:
+        return True
+    lowered = raw.lower()
+    return any(t in lowered for t in _REDACTION_TRIGGERS_BYTES)
+
+
 class CurationEngine:
     """Crates training datasets from raw runs with secret redaction."""
 
     def __init__(self):
         self.config = ConfigLoader.load()
-        # Common secret patterns (API keys, tokens, etc.)
-        self.redaction_patterns = [
-            re.compile(r"sk-[a-zA-Z0-9]{32,}", re.I),           # OpenAI
-            re.compile(r"gh[oprs]_[a-zA-Z0-9]{36,}", re.I),     # GitHub
-            re.compile(r"(?:password|secret|key|token)\s*[=:]\s*['\"]?([a-zA-Z0-9_\-]{8,})['\"]?", re.I),
-        ]
+        # Runs repeat the same system prompts and messages, so memoize short inputs
+        self._redact_cached = functools.lru_cache(maxsize=2048)(self._redact_impl)
 
     def redact_text(self, text: str) -> str:
         """Apply all redaction patterns to a string."""
-        redacted = text
-        for pattern in self.redaction_patterns:
-            redacted = pattern.sub("[REDACTED]", redacted)
-        return redacted
+        if len(text) > REDACTION_CACHE_MAX_LEN:
+            return self._redact_impl(text)
+        return self._redact_cached(text)
+
+    def _redact_impl(self, text: str) -> str:
+        # str.lower() misses re.I folds such as "ſ" -> "s", so only ASCII may skip the scan
+        if text.isascii():
+            lowered = text.lower()
+            if not any(t in lowered for t in REDACTION_TRIGGERS):
+                return text
+        return _REDACTION_RE.sub("[REDACTED]", text)
 
     def redact_json(self, data: Any) -> Any:
         """Recursively redact secrets from a JSON-like object."""
@@ -34,7 +99,7 @@ class CurationEngine:
             for k, v in data.items():
                 # If key looks like a secret, redact the value directly
                 k_lower = str(k).lower()
-                if any(sec in k_lower for sec in ["password", "secret", "key", "token"]):
+                if any(sec in k_lower for sec in SECRET_KEY_HINTS):
                     if isinstance(v, str) and len(v) > 5:
                         result[k] = "[REDACTED]"
                     else:
@@ -51,38 +116,54 @@ class CurationEngine:
         raw_root = self.config.state_dirs["datasets_raw"]
         curated_root = self.config.state_dirs["datasets_curated"]
         
-        curated_data = []
+        # Curated records stream straight to disk rather than piling up in memory;
+        # the .partial name keeps a half-written dataset out of dataset_*.jsonl globs
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = curated_root / f"dataset_{stamp}.jsonl"
+        partial_file = output_file.with_name(output_file.name + ".partial")
+        out = None
         count = 0
-        
-        # Iterate through dated folders
-        for date_dir in raw_root.iterdir():
-            if not date_dir.is_dir():
-                continue
-            if date_filter and date_dir.name != date_filter:
-                continue
-            
-            for run_dir in date_dir.iterdir():
-                if not run_dir.is_dir():
-                    continue
-                run_file = run_dir / "run.json"
-                if not run_file.exists():
-                    continue
-                
-                with open(run_file, "r") as f:
-                    raw_run = json.load(f)
-                    
-                # Redact and add to collection
-                curated_run = self.redact_json(raw_run)
-                curated_data.append(curated_run)
-                count += 1
-
-        if curated_data:
-            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = curated_root / f"dataset_{stamp}.jsonl"
-            with open(output_file, "w") as f:
-                for entry in curated_data:
-                    f.write(json.dumps(entry) + "\n")
-                    
+
+        # Iterate through dated folders; DirEntry.is_dir() reuses the d_type from readdir
+        with os.scandir(raw_root) as date_entries:
+            date_dirs = [
+                entry.path
+                for entry in date_entries
+                if entry.is_dir() and (not date_filter or entry.name == date_filter)
+            ]
+
+        try:
+            for date_dir in date_dirs:
+                with os.scandir(date_dir) as run_entries:
+                    run_dirs = [entry.path for entry in run_entries if entry.is_dir()]
+
+                for run_dir in run_dirs:
+                    try:
+                        raw_bytes = Path(run_dir, "run.json").read_bytes()
+                    except FileNotFoundError:
+                        continue
+
+                    raw_run = _load_json(raw_bytes)
+
+                    # Redact and write out; one scan of the raw bytes usually rules out secrets
+                    if _may_need_redaction(raw_bytes):
+                        curated_run = self.redact_json(raw_run)
+                    else:
+                        curated_run = raw_run
+                    if out is None:
+                        out = open(partial_file, "wb")
+                    out.write(_dump_json_line(curated_run))
+                    count += 1
+        except BaseException:
+            if out is not None:
+                out.close()
+                partial_file.unlink(missing_ok=True)
+            raise
+
+        if out is not None:
+            out.close()
+            os.replace(partial_file, output_file)
+
         return count
 
 curation_engine = CurationEngine()
@@ -11,6 +11,8 @@ from ..shared.config import ConfigLoader
 
 logger = logging.getLogger("heidi.registry")
 
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
 class ModelRegistry:
     """Manages model versions and promotion channels."""
 
@@ -27,12 +29,11 @@ class ModelRegistry:
                 "active_candidate": None,
                 "versions": {}
             }
-            with open(self.registry_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self.save_registry(data)
 
     def load_registry(self) -> Dict[str, Any]:
-        with open(self.registry_file, "r") as f:
-            return json.load(f)
+        # json.loads takes the raw bytes; skip the text-mode decode into an interim str
+        return json.loads(self.registry_file.read_bytes())
 
     def save_registry(self, data: Dict[str, Any]):
         with open(self.registry_file, "w") as f:
@@ -86,14 +87,13 @@ class ModelRegistry:
         """Calculate SHA-256 checksum for model directory."""
         hash_sha256 = hashlib.sha256()
         
-        if path.is_file():
-            with open(path, "rb") as f:
-                hash_sha256.update(f.read())
-        else:
-            for file_path in sorted(path.rglob("*")):
-                if file_path.is_file():
-                    with open(file_path, "rb") as f:
-                        hash_sha256.update(f.read())
+        # Model weights run to gigabytes; hash in fixed-size chunks instead of read()
+        # so memory stays flat. The digest is identical to hashing whole files.
+        files = [path] if path.is_file() else (p for p in sorted(path.rglob("*")) if p.is_file())
+        for file_path in files:
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+                    hash_sha256.update(chunk)
         
         return hash_sha256.hexdigest()
     
@@ -26,10 +26,10 @@ class RetrainingEngine:
         if not dataset_path:
             # Find the latest curated dataset
             curated_dir = self.config.state_dirs["datasets_curated"]
-            datasets = sorted(curated_dir.glob("dataset_*.jsonl"))
-            if not datasets:
+            # Names embed a sortable timestamp, so the max is the latest; no full sort needed
+            dataset_path = max(curated_dir.glob("dataset_*.jsonl"), default=None)
+            if dataset_path is None:
                 raise FileNotFoundError("No curated datasets found for retraining.")
-            dataset_path = datasets[-1]
 
         job_id = f"train-{datetime.now().strftime('%Y%m%d%H%M%S')}-{str(uuid.uuid4())[:8]}"
         logger.info(f"Starting retraining job {job_id} using dataset {dataset_path.name}")
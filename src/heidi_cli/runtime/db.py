@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sqlite3
 import threading
 from pathlib import Path
@@ -25,15 +26,32 @@ class DatabaseManager:
         # Use config path or fallback to state/memory/memory.db
         self.db_path = self.config.memory_sqlite_path or (self.config.data_root / "memory" / "memory.db")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # sqlite3 connections are bound to the thread that opened them
+        self._local = threading.local()
         
         self.initialized = True
         self.init_schema()
 
     def get_connection(self) -> sqlite3.Connection:
+        # Reuse this thread's connection; `with conn:` only commits, it never closes.
+        # A moved db_path or a replaced file gets a fresh connection.
+        key = (self.db_path, self._file_id())
+        cached = getattr(self._local, "cached", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        self._local.cached = ((self.db_path, self._file_id()), conn)
         return conn
 
+    def _file_id(self):
+        try:
+            st = os.stat(self.db_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_dev, st.st_ino)
+
     def init_schema(self):
         """Initialize database schema from SQL file."""
         schema_path = Path(__file__).parent / "schema.sql"
@@ -18,6 +18,13 @@ import logging
 
 logger = logging.getLogger("heidi.security")
 
+# Per-tier rate limits, built once; unknown tiers fall back to "basic"
+TIER_LIMITS: Dict[str, Dict[str, int]] = {
+    "basic": {"rpm": 60, "tpm": 10000},
+    "premium": {"rpm": 300, "tpm": 50000},
+    "enterprise": {"rpm": 1000, "tpm": 200000},
+}
+
 @dataclass
 class User:
     """User account."""
@@ -148,6 +155,7 @@ class SecurityManager:
         """Create a new user."""
         user_id = secrets.token_urlsafe(16)
         api_key = f"hd_{secrets.token_urlsafe(32)}"
+        limits = self._get_tier_limits(tier)
         
         user = User(
             id=user_id,
@@ -156,8 +164,8 @@ class SecurityManager:
             api_key=api_key,
             created_at=datetime.now(timezone.utc),
             tier=tier,
-            rate_limit_rpm=self._get_tier_limits(tier)["rpm"],
-            rate_limit_tpm=self._get_tier_limits(tier)["tpm"]
+            rate_limit_rpm=limits["rpm"],
+            rate_limit_tpm=limits["tpm"]
         )
         
         with sqlite3.connect(self.db_path) as conn:
@@ -418,12 +426,7 @@ class SecurityManager:
     
     def _get_tier_limits(self, tier: str) -> Dict[str, int]:
         """Get rate limits for user tier."""
-        limits = {
-            "basic": {"rpm": 60, "tpm": 10000},
-            "premium": {"rpm": 300, "tpm": 50000},
-            "enterprise": {"rpm": 1000, "tpm": 200000}
-        }
-        return limits.get(tier, limits["basic"])
+        return TIER_LIMITS.get(tier, TIER_LIMITS["basic"])
     
     def _update_user_activity(self, user_id: str):
         """Update user's last activity timestamp."""
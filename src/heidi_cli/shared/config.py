@@ -2,29 +2,42 @@ from __future__ import annotations
 
 import os
 import json
+import functools
 from pathlib import Path
 from typing import Optional, Dict, List
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 def find_project_root() -> Path:
     """Find the project root by walking up for pyproject.toml."""
-    current = Path.cwd().resolve()
+    return _find_project_root_from(os.getcwd())
+
+
+@functools.lru_cache(maxsize=32)
+def _find_project_root_from(cwd: str) -> Path:
+    # Every ConfigLoader.load() lands here; cache the resolve + exists() walk per cwd
+    current = Path(cwd).resolve()
     while current != current.parent:
         if (current / "pyproject.toml").exists():
             return current
         current = current.parent
-    return Path.cwd().resolve()
+    return Path(cwd).resolve()
 
 
 def get_default_state_root() -> Path:
     """Get the default state root for the learning suite."""
     env_root = os.environ.get("HEIDI_STATE_ROOT")
     if env_root:
-        return Path(env_root).expanduser().resolve()
+        return _resolve_state_root(env_root, os.getcwd())
     return find_project_root() / "state"
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_state_root(env_root: str, cwd: str) -> Path:
+    # Keyed on the env value and cwd: a relative HEIDI_STATE_ROOT resolves against the cwd
+    return (Path(cwd) / Path(env_root).expanduser()).resolve()
+
+
 class ModelConfig(BaseModel):
     id: str
     path: Path
@@ -78,10 +91,16 @@ class SuiteConfig(BaseModel):
 
     log_level: str = "info"
 
+    # (data_root, dirs) memo so repeated state_dirs lookups skip rebuilding every Path
+    _state_dirs_cache: Optional[tuple] = PrivateAttr(default=None)
+
     @property
     def state_dirs(self) -> Dict[str, Path]:
         root = self.data_root
-        return {
+        cached = self._state_dirs_cache
+        if cached is not None and cached[0] == root:
+            return dict(cached[1])
+        dirs = {
             "config": root / "config",
             "memory": root / "memory",
             "events": root / "events",
@@ -94,6 +113,8 @@ class SuiteConfig(BaseModel):
             "logs": root / "logs",
             "evals": root / "evals",
         }
+        self._state_dirs_cache = (root, dirs)
+        return dict(dirs)
 
     def ensure_dirs(self):
         for path in self.state_dirs.values():
@@ -123,6 +144,17 @@ class SuiteConfig(BaseModel):
         return d
 
 
+# (field, env var, annotation) per overridable field, built once instead of per load()
+# "models" is skipped: a JSON list of models is not settable from the environment
+_ENV_OVERRIDES = tuple(
+    (field, f"HEIDI_SUITE_{field.upper()}", info.annotation)
+    for field, info in SuiteConfig.model_fields.items()
+    if field != "models"
+)
+
+_TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes"})
+
+
 class ConfigLoader:
     @staticmethod
     def load() -> SuiteConfig:
@@ -145,18 +177,12 @@ class ConfigLoader:
             config = SuiteConfig()
 
         # Env overrides
-        for field in SuiteConfig.model_fields:
-            env_key = f"HEIDI_SUITE_{field.upper()}"
+        for field, env_key, target_type in _ENV_OVERRIDES:
             env_val = os.environ.get(env_key)
             if env_val:
                 try:
-                    if field == "models":
-                        # Special handling for models JSON list via env if needed
-                        continue
-
-                    target_type = SuiteConfig.model_fields[field].annotation
                     if target_type is bool:
-                        setattr(config, field, env_val.lower() in ("true", "1", "yes"))
+                        setattr(config, field, env_val.lower() in _TRUTHY_ENV_VALUES)
                     elif target_type is int:
                         setattr(config, field, int(env_val))
                     elif target_type is float:
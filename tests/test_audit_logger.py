@@ -0,0 +1,108 @@
+"""
+Tests for buffered audit event writes.
+"""
+
+import sqlite3
+
+import pytest
+
+import heidi_cli.audit.logger as audit_module
+from heidi_cli.audit.logger import AuditLevel, AuditLogger, ComplianceCategory
+
+BROKEN_INSERT_SQL = "INSERT INTO missing_table VALUES (?)"
+
+
+@pytest.fixture
+def audit_logger(tmp_path_factory, monkeypatch):
+    """Create an audit logger backed by a throwaway database."""
+    # Without the background threads, flushes happen only where a test expects them
+    monkeypatch.setattr(AuditLogger, "_start_flush_thread", lambda self: None)
+    monkeypatch.setattr(AuditLogger, "_start_cleanup_thread", lambda self: None)
+    return AuditLogger(tmp_path_factory.mktemp("audit") / "audit.db")
+
+
+def log_access(audit_logger, user_id="test-user"):
+    return audit_logger.log_event(
+        level=AuditLevel.INFO,
+        category=ComplianceCategory.ACCESS,
+        action="read",
+        resource="model:test-model",
+        user_id=user_id,
+    )
+
+
+def stored_event_count(audit_logger):
+    with sqlite3.connect(audit_logger.db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0]
+
+
+class TestAuditBuffering:
+    """Test the pending buffer between log_event and the database."""
+
+    def test_logged_event_visible_to_search(self, audit_logger):
+        """Test that search_events flushes buffered events first."""
+        event_id = log_access(audit_logger)
+
+        events = audit_logger.search_events(user_id="test-user")
+        assert [e.event_id for e in events] == [event_id]
+
+    def test_failed_insert_requeues_batch(self, audit_logger, monkeypatch):
+        """Test that a failed executemany keeps the batch for the next flush."""
+        with monkeypatch.context() as m:
+            m.setattr(audit_module, "_INSERT_EVENT_SQL", BROKEN_INSERT_SQL)
+            event_id = log_access(audit_logger)
+            with pytest.raises(sqlite3.OperationalError):
+                audit_logger.flush()
+            assert [row[0] for row in audit_logger._pending] == [event_id]
+
+        audit_logger.flush()
+        assert audit_logger._pending == []
+        assert stored_event_count(audit_logger) == 1
+
+    def test_max_pending_flushes_inline(self, audit_logger, monkeypatch):
+        """Test that reaching AUDIT_MAX_PENDING writes the buffer from log_event."""
+        monkeypatch.setattr(audit_module, "AUDIT_MAX_PENDING", 3)
+
+        for _ in range(3):
+            log_access(audit_logger)
+
+        assert audit_logger._pending == []
+        assert stored_event_count(audit_logger) == 3
+
+    def test_inline_flush_failure_does_not_raise(self, audit_logger, monkeypatch):
+        """Test that an inline flush error is logged, not raised after queueing."""
+        monkeypatch.setattr(audit_module, "AUDIT_MAX_PENDING", 1)
+        monkeypatch.setattr(audit_module, "_INSERT_EVENT_SQL", BROKEN_INSERT_SQL)
+
+        event_id = log_access(audit_logger)
+
+        assert [row[0] for row in audit_logger._pending] == [event_id]
+
+    def test_pending_stays_capped_while_inserts_fail(self, audit_logger, monkeypatch):
+        """Test that a failing database keeps only the newest AUDIT_MAX_PENDING events."""
+        monkeypatch.setattr(audit_module, "AUDIT_MAX_PENDING", 3)
+        monkeypatch.setattr(audit_module, "_INSERT_EVENT_SQL", BROKEN_INSERT_SQL)
+
+        event_ids = [log_access(audit_logger) for _ in range(10)]
+        with pytest.raises(sqlite3.OperationalError):
+            audit_logger.flush()
+
+        assert [row[0] for row in audit_logger._pending] == event_ids[-3:]
+
+    def test_inline_flush_backs_off_after_failure(self, audit_logger, monkeypatch):
+        """Test that a failed inline flush is not retried on every following event."""
+        monkeypatch.setattr(audit_module, "AUDIT_MAX_PENDING", 1)
+        monkeypatch.setattr(audit_module, "_INSERT_EVENT_SQL", BROKEN_INSERT_SQL)
+        attempts = []
+        flush = audit_logger.flush
+
+        def counting_flush():
+            attempts.append(1)
+            flush()
+
+        monkeypatch.setattr(audit_logger, "flush", counting_flush)
+
+        for _ in range(5):
+            log_access(audit_logger)
+
+        assert len(attempts) == 1
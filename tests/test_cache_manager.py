@@ -0,0 +1,52 @@
+"""
+Tests for the in-memory cache backend.
+"""
+
+import time
+
+from heidi_cli.cache.manager import MemoryCache
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestMemoryCacheSweeper:
+    """Test background eviction of expired entries."""
+
+    def test_sweeper_evicts_expired_entry_without_get(self):
+        """Test that an expired entry is dropped without anyone reading it."""
+        cache = MemoryCache()
+        cache.set("stale", "value", ttl_seconds=0)
+        cache.set("fresh", "value")
+
+        cache.start_sweeper(interval=0.01)
+        try:
+            assert wait_for(lambda: "stale" not in cache._cache)
+        finally:
+            cache.stop_sweeper()
+
+        assert "fresh" in cache._cache
+
+    def test_sweeper_restarts_after_stop(self):
+        """Test that start_sweeper works again once the sweeper was stopped."""
+        cache = MemoryCache()
+        cache.start_sweeper(interval=0.01)
+        first = cache._sweeper
+        cache.stop_sweeper()
+
+        assert not first.is_alive()
+        assert cache._sweeper is None
+
+        cache.set("stale", "value", ttl_seconds=0)
+        cache.start_sweeper(interval=0.01)
+        try:
+            assert cache._sweeper is not first
+            assert wait_for(lambda: "stale" not in cache._cache)
+        finally:
+            cache.stop_sweeper()
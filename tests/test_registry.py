@@ -1,7 +1,11 @@
 import pytest
+import asyncio
 import shutil
 from pathlib import Path
 
+# Every module that uses /tmp/test_heidi_data wipes it per test, so they share a worker
+pytestmark = pytest.mark.xdist_group("heidi_data")
+
 class MockConfig:
     data_root = Path("/tmp/test_heidi_data")
     state_dirs = {
@@ -34,7 +38,6 @@ def setup_test_dirs(monkeypatch):
         shutil.rmtree(MockConfig.data_root)
 
 def test_registry_registration_and_promotion():
-    import asyncio
     asyncio.run(_test_registry_registration_and_promotion())
 
 async def _test_registry_registration_and_promotion():
@@ -59,7 +62,6 @@ async def _test_registry_registration_and_promotion():
     assert reg["active_stable"] == "v1_exp"
 
 def test_eval_harness():
-    import asyncio
     asyncio.run(_test_eval_harness())
 
 async def _test_eval_harness():
@@ -77,7 +79,6 @@ async def _test_eval_harness():
     assert results["candidate_id"] == "v2_cand"
 
 def test_hotswap_manager(monkeypatch):
-    import asyncio
     asyncio.run(_test_hotswap_manager(monkeypatch))
 
 async def _test_hotswap_manager(monkeypatch):
@@ -97,3 +98,14 @@ async def _test_hotswap_manager(monkeypatch):
     
     success2 = await hotswap_manager.reload_stable_model()
     assert success2 is False
+
+def test_unsaved_registry_edits_are_not_loaded_back():
+    from heidi_cli.registry.manager import model_registry
+
+    data = model_registry.load_registry()
+    data["active_stable"] = "half_applied"
+    data["versions"]["ghost"] = {"channel": "stable"}
+
+    reg = model_registry.load_registry()
+    assert reg["active_stable"] is None
+    assert "ghost" not in reg["versions"]
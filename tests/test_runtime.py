@@ -2,6 +2,9 @@ import pytest
 import asyncio
 from pathlib import Path
 
+# Every module that uses /tmp/test_heidi_data wipes it per test, so they share a worker
+pytestmark = pytest.mark.xdist_group("heidi_data")
+
 # Mock config so the test database goes to an in-memory or throwaway location
 class MockConfig:
     data_root = Path("/tmp/test_heidi_data")
@@ -3,11 +3,8 @@ Comprehensive tests for token tracking functionality.
 """
 
 import pytest
-import tempfile
-import shutil
 import json
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 from heidi_cli.token_tracking.models import (
@@ -15,6 +12,26 @@ from heidi_cli.token_tracking.models import (
 )
 
 
+@pytest.fixture
+def temp_db(tmp_path_factory):
+    """Create temporary database."""
+    return TokenDatabase(tmp_path_factory.mktemp("tokens") / "test_tokens.db")
+
+
+@pytest.fixture
+def sample_usage():
+    """A typical usage record for database round-trip tests."""
+    return TokenUsage(
+        model_id="test-model",
+        session_id="test-session",
+        user_id="test-user",
+        prompt_tokens=100,
+        completion_tokens=50,
+        total_tokens=150,
+        cost_usd=0.01
+    )
+
+
 class TestTokenUsage:
     """Test TokenUsage dataclass."""
     
@@ -76,38 +93,29 @@ class TestCostConfig:
         assert config.output_cost_per_1k == 0.06
         assert config.currency == "USD"
     
-    def test_cost_calculation(self):
-        """Test cost calculation."""
+    @pytest.mark.parametrize(
+        "input_cost,output_cost,prompt_tokens,completion_tokens,expected_cost", [
+            (0.03, 0.06, 1000, 500, 0.06),  # 0.03 + 0.03
+            (0.01, 0.02, 0, 0, 0.0),
+            (0.01, 0.02, 1, 1, (1/1000) * 0.01 + (1/1000) * 0.02),
+        ]
+    )
+    def test_cost_calculation(self, input_cost, output_cost, prompt_tokens,
+                              completion_tokens, expected_cost):
+        """Test cost calculation, including zero and very small token counts."""
         config = CostConfig(
             provider="openai",
             model_id="gpt-4",
-            input_cost_per_1k=0.03,
-            output_cost_per_1k=0.06
+            input_cost_per_1k=input_cost,
+            output_cost_per_1k=output_cost
         )
         
-        # Test cost calculation
-        prompt_tokens = 1000
-        completion_tokens = 500
-        
-        expected_cost = (1000 / 1000) * 0.03 + (500 / 1000) * 0.06
-        actual_cost = config.calculate_cost(prompt_tokens, completion_tokens)
-        
-        assert actual_cost == expected_cost
-        assert actual_cost == 0.06  # 0.03 + 0.03
+        assert config.calculate_cost(prompt_tokens, completion_tokens) == expected_cost
 
 
 class TestTokenDatabase:
     """Test TokenDatabase functionality."""
     
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database."""
-        temp_dir = Path(tempfile.mkdtemp())
-        db_path = temp_dir / "test_tokens.db"
-        db = TokenDatabase(db_path)
-        yield db
-        shutil.rmtree(temp_dir)
-    
     def test_database_initialization(self, temp_db):
         """Test database initialization."""
         assert temp_db.db_path.exists()
@@ -123,19 +131,9 @@ class TestTokenDatabase:
             assert 'token_usage' in tables
             assert 'cost_configs' in tables
     
-    def test_record_usage(self, temp_db):
+    def test_record_usage(self, temp_db, sample_usage):
         """Test recording token usage."""
-        usage = TokenUsage(
-            model_id="test-model",
-            session_id="test-session",
-            user_id="test-user",
-            prompt_tokens=100,
-            completion_tokens=50,
-            total_tokens=150,
-            cost_usd=0.01
-        )
-        
-        record_id = temp_db.record_usage(usage)
+        record_id = temp_db.record_usage(sample_usage)
         assert record_id is not None
         assert record_id > 0
     
@@ -243,19 +241,9 @@ class TestTokenDatabase:
         non_existent = temp_db.get_cost_config("nonexistent", "model")
         assert non_existent is None
     
-    def test_export_usage(self, temp_db):
+    def test_export_usage(self, temp_db, sample_usage):
         """Test usage data export."""
-        # Create test data
-        usage = TokenUsage(
-            model_id="test-model",
-            session_id="test-session",
-            user_id="test-user",
-            prompt_tokens=100,
-            completion_tokens=50,
-            total_tokens=150,
-            cost_usd=0.01
-        )
-        temp_db.record_usage(usage)
+        temp_db.record_usage(sample_usage)
         
         # Test JSON export
         json_export = temp_db.export_usage(format="json")
@@ -333,15 +321,6 @@ class TestTokenTrackingIntegration:
 class TestTokenTrackingEdgeCases:
     """Test edge cases and error handling."""
     
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database."""
-        temp_dir = Path(tempfile.mkdtemp())
-        db_path = temp_dir / "test_tokens.db"
-        db = TokenDatabase(db_path)
-        yield db
-        shutil.rmtree(temp_dir)
-    
     def test_empty_usage_history(self, temp_db):
         """Test getting usage history when no data exists."""
         history = temp_db.get_usage_history()
@@ -373,24 +352,6 @@ class TestTokenTrackingEdgeCases:
         """Test export with invalid format."""
         with pytest.raises(ValueError, match="Unsupported export format"):
             temp_db.export_usage(format="invalid")
-    
-    def test_cost_calculation_edge_cases(self):
-        """Test cost calculation with edge cases."""
-        config = CostConfig(
-            provider="test",
-            model_id="test-model",
-            input_cost_per_1k=0.01,
-            output_cost_per_1k=0.02
-        )
-        
-        # Test with zero tokens
-        cost = config.calculate_cost(0, 0)
-        assert cost == 0.0
-        
-        # Test with very small numbers
-        cost = config.calculate_cost(1, 1)
-        expected = (1/1000) * 0.01 + (1/1000) * 0.02
-        assert cost == expected
 
 
 if __name__ == "__main__":
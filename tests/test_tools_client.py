@@ -0,0 +1,180 @@
+"""
+Tests for the OpenWebUI Heidi pipe in tools/client.py.
+"""
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+_CLIENT_PATH = Path(__file__).parent.parent / "tools" / "client.py"
+_spec = importlib.util.spec_from_file_location("heidi_pipe_client", _CLIENT_PATH)
+client = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(client)
+
+
+def make_pipe(handler):
+    """Build a Pipe whose HTTP traffic goes to an in-process handler."""
+    pipe = client.Pipe()
+    pipe._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return pipe
+
+
+def run_payload(prompt, executor="copilot", model="gpt-5"):
+    return {"prompt": prompt, "executor": executor, "model": model}
+
+
+async def dispatch(pipe, payloads):
+    """Run one batch through _dispatch_batch and collect each prompt's outcome."""
+    loop = asyncio.get_running_loop()
+    futures = [loop.create_future() for _ in payloads]
+    await asyncio.wait_for(pipe._dispatch_batch(list(zip(payloads, futures))), timeout=5)
+    await pipe.close()
+    return [f.exception() or f.result() for f in futures]
+
+
+class TestDispatchBatch:
+    """Test grouping of queued prompts into /batch and /run requests."""
+
+    def test_batch_results_resolve_in_order(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            prompts = json.loads(request.content)["prompts"]
+            return httpx.Response(200, json={"results": [{"result": p} for p in prompts]})
+
+        pipe = make_pipe(handler)
+        results = asyncio.run(dispatch(pipe, [run_payload("a"), run_payload("b")]))
+
+        assert requests == ["/batch"]
+        assert results == [{"result": "a"}, {"result": "b"}]
+
+    @pytest.mark.parametrize("status_code", [404, 405])
+    def test_missing_batch_endpoint_falls_back_to_run(self, status_code):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            if request.url.path == "/batch":
+                return httpx.Response(status_code)
+            return httpx.Response(200, json={"result": json.loads(request.content)["prompt"]})
+
+        pipe = make_pipe(handler)
+        results = asyncio.run(dispatch(pipe, [run_payload("a"), run_payload("b")]))
+
+        assert requests == ["/batch", "/run", "/run"]
+        assert results == [{"result": "a"}, {"result": "b"}]
+        assert pipe._batch_supported is False
+
+    def test_result_count_mismatch_fails_without_rerunning(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(200, json={"results": [{"result": "only one"}]})
+
+        pipe = make_pipe(handler)
+        results = asyncio.run(dispatch(pipe, [run_payload("a"), run_payload("b")]))
+
+        assert requests == ["/batch"]
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_batch_error_fails_every_future(self):
+        def handler(request):
+            return httpx.Response(500)
+
+        pipe = make_pipe(handler)
+        results = asyncio.run(dispatch(pipe, [run_payload("a"), run_payload("b")]))
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+    def test_mixed_groups_dispatch_concurrently(self):
+        run_seen = asyncio.Event()
+
+        async def handler(request):
+            body = json.loads(request.content)
+            if request.url.path == "/batch":
+                # Only answers once the other group's /run has been sent
+                await run_seen.wait()
+                return httpx.Response(
+                    200, json={"results": [{"result": p} for p in body["prompts"]]}
+                )
+            run_seen.set()
+            return httpx.Response(200, json={"result": body["prompt"]})
+
+        pipe = make_pipe(handler)
+        results = asyncio.run(
+            dispatch(
+                pipe,
+                [
+                    run_payload("a"),
+                    run_payload("b"),
+                    run_payload("c", executor="opencode", model=None),
+                ],
+            )
+        )
+
+        assert results == [{"result": "a"}, {"result": "b"}, {"result": "c"}]
+
+    def test_close_fails_waiting_callers(self):
+        in_flight = asyncio.Event()
+
+        async def handler(request):
+            in_flight.set()
+            await asyncio.Event().wait()  # The server never answers
+
+        async def scenario():
+            pipe = make_pipe(handler)
+            messages = [{"role": "user", "content": "hi"}]
+            chats = [asyncio.create_task(pipe.chat_orchestrated(messages)) for _ in range(2)]
+            await asyncio.wait_for(in_flight.wait(), timeout=5)
+            # A third caller queues up behind the in-flight batch
+            queued = asyncio.create_task(pipe.chat_orchestrated(messages))
+            await asyncio.sleep(0)
+            await pipe.close()
+            return await asyncio.wait_for(asyncio.gather(*chats, queued), timeout=5)
+
+        replies = asyncio.run(scenario())
+
+        assert len(replies) == 3
+        assert all("Heidi pipe closed" in reply for reply in replies)
+
+
+async def collect(pipe, messages):
+    """Drain stream_orchestrated into a list of yielded chunks."""
+    chunks = [chunk async for chunk in pipe.stream_orchestrated(messages)]
+    await pipe.close()
+    return chunks
+
+
+class TestStreamOrchestrated:
+    """Test SSE parsing and the buffered JSON fallback of stream_orchestrated."""
+
+    def test_parses_sse_frames(self):
+        accept = []
+
+        def handler(request):
+            accept.append(request.headers.get("accept"))
+            body = "data: hello\n\ndata: line one\ndata: line two\n\ndata: [DONE]\n\ndata: late\n\n"
+            return httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, content=body.encode()
+            )
+
+        pipe = make_pipe(handler)
+        chunks = asyncio.run(collect(pipe, [{"role": "user", "content": "hi"}]))
+
+        assert accept == ["text/event-stream"]
+        assert chunks == ["hello", "line one\nline two"]
+
+    def test_falls_back_to_json_result(self):
+        def handler(request):
+            return httpx.Response(200, json={"status": "completed", "result": "all done"})
+
+        pipe = make_pipe(handler)
+        chunks = asyncio.run(collect(pipe, [{"role": "user", "content": "hi"}]))
+
+        assert chunks == ["all done"]
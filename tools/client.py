@@ -6,15 +6,29 @@ version: 2.1.0
 """
 
 import asyncio
+import functools
 import logging
-from typing import List, Union, Generator, Iterator
+import shutil
+import time
+from typing import AsyncIterator, List, Optional, Sequence, Tuple, Union, Generator, Iterator
 
 import httpx
-import requests
 from pydantic import BaseModel, Field
 
 
-COPILOT_MODELS = [
+# How long /models and /agents responses stay cached (seconds)
+CACHE_TTL = 300
+# Past CACHE_TTL, stale entries are still served while refreshing in the background
+CACHE_STALE_TTL = 1800
+
+# `opencode models openai` spawns a Node process, so its output is reused this long
+OPENCODE_MODELS_TTL = 60
+
+# Concurrent orchestrated chats arriving within this window share one POST /batch
+BATCH_WINDOW = 0.025
+MAX_BATCH = 16
+
+COPILOT_MODELS: Tuple[str, ...] = (
     "gpt-5",
     "claude-sonnet-4-20250514",
     "claude-3-7-sonnet-20250219",
@@ -22,7 +36,34 @@ COPILOT_MODELS = [
     "gpt-4o-mini",
     "o3",
     "o4-mini",
-]
+)
+
+AGENTS_TABLE_HEADER = (
+    "### 🤖 Available Agents\n\n| Agent | Description |\n|-------|-------------|\n"
+)
+RUNS_TABLE_HEADER = "### 📋 Recent Runs\n\n| Run ID | Status | Task |\n|--------|--------|------|\n"
+
+
+def heidi_http_errors(context: str):
+    """Turn exceptions from a Pipe coroutine into the user-facing error message."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except Exception as e:
+                return self._handle_request_error(e, context)
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    """Resolve an executable on PATH once per process (_which.cache_clear() to rescan)."""
+    return shutil.which(name)
 
 
 class Pipe:
@@ -63,6 +104,13 @@ class Pipe:
         OLLAMA_MODEL: str = Field(default="llama3", description="Ollama model name")
 
         REQUEST_TIMEOUT: int = Field(default=300, description="Request timeout in seconds")
+        STREAM_RESPONSES: bool = Field(
+            default=False,
+            description="Stream chat output via SSE (requires server text/event-stream support)",
+        )
+
+    # Message prefix -> handler method for "loop: ...", "run: ..." and "chat: ..."
+    PREFIX_COMMANDS = {"loop": "execute_loop", "run": "execute_run", "chat": "chat_simple"}
 
     def __init__(self):
         self.valves = self.Valves()
@@ -71,6 +119,17 @@ class Pipe:
         self._agents_cache_time = 0
         self._models_cache = None
         self._models_cache_time = 0
+        self._opencode_models_cache = None
+        self._opencode_models_cache_time = 0
+        self._agents_lock = asyncio.Lock()
+        self._models_lock = asyncio.Lock()
+        self._background_tasks = set()
+        self._batch_queue = None
+        self._batch_flusher = None
+        # Futures of micro-batched /run calls that have not been resolved yet
+        self._batch_futures = set()
+        self._batch_supported = True
+        self._http = None
 
     @property
     def server_url(self) -> str:
@@ -78,6 +137,41 @@ class Pipe:
             return self._server_url
         return self.valves.HEIDI_SERVER_URL
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to the Heidi server alive across
+        requests instead of paying a TCP (and TLS) handshake per call.
+        """
+        if self._http is None or self._http.is_closed:
+            # httpx ignores AsyncClient(limits=) once a transport is given, so the
+            # pool bounds go on the transport itself
+            self._http = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    retries=3,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+                ),
+            )
+        return self._http
+
+    async def close(self):
+        """Close the shared HTTP client; call this before discarding the pipe."""
+        if self._batch_flusher is not None:
+            self._batch_flusher.cancel()
+            self._batch_flusher = None
+        self._batch_queue = None
+        # In-flight dispatches would reopen the client via _get_http
+        for task in list(self._background_tasks):
+            task.cancel()
+        # Fail queued and in-flight prompts so their callers do not wait forever
+        for future in list(self._batch_futures):
+            if not future.done():
+                future.set_exception(RuntimeError("Heidi pipe closed"))
+        self._batch_futures.clear()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     def _get_headers(self) -> dict:
         """Get request headers including API key if set."""
         headers = {"Content-Type": "application/json"}
@@ -85,29 +179,51 @@ class Pipe:
             headers["X-Heidi-Key"] = self.valves.HEIDI_API_KEY
         return headers
 
-    async def _fetch_models(self) -> List[str]:
-        """Fetch available Copilot models from Heidi server."""
-        import time
+    def _refresh_in_background(self, refresh) -> None:
+        """Schedule a cache refresh without making the caller wait for it."""
+        task = asyncio.create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
-        now = time.time()
-        if self._models_cache and (now - self._models_cache_time) < 300:
+    async def _fetch_models(self) -> Sequence[str]:
+        """Fetch available Copilot models from Heidi server."""
+        age = time.monotonic() - self._models_cache_time
+        if self._models_cache is not None and age < CACHE_STALE_TTL:
+            if age >= CACHE_TTL and not self._models_lock.locked():
+                self._refresh_in_background(self._refresh_models)
             return self._models_cache
 
-        try:
-            url = f"{self.server_url}/models"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self._get_headers(), timeout=10)
-            if response.status_code == 200:
-                models_data = response.json()
-                if isinstance(models_data, list):
-                    model_ids = [m.get("id", m.get("name", "")) for m in models_data]
-                    self._models_cache = [m for m in model_ids if m]
-                    self._models_cache_time = now
-                    return self._models_cache
-        except Exception:
-            pass
+        models = await self._refresh_models()
+        return models if models is not None else COPILOT_MODELS
 
-        return COPILOT_MODELS
+    async def _refresh_models(self) -> Optional[List[str]]:
+        """GET /models into the cache; returns None if the server gave nothing usable."""
+        async with self._models_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if (
+                self._models_cache is not None
+                and (time.monotonic() - self._models_cache_time) < CACHE_TTL
+            ):
+                return self._models_cache
+
+            try:
+                url = f"{self.server_url}/models"
+                response = await self._get_http().get(url, headers=self._get_headers(), timeout=10)
+                if response.status_code == 200:
+                    models_data = response.json()
+                    if isinstance(models_data, list):
+                        model_ids = []
+                        for m in models_data:
+                            mid = m.get("id") or m.get("name")
+                            if mid:
+                                model_ids.append(mid)
+                        self._models_cache = model_ids
+                        self._models_cache_time = time.monotonic()
+                        return self._models_cache
+            except Exception:
+                pass
+
+        return None
 
     def _get_executor_and_model(self, model_id: str = None) -> tuple:
         """Extract executor and model from model ID (e.g., 'copilot/gpt-5' -> ('copilot', 'gpt-5'))."""
@@ -130,26 +246,15 @@ class Pipe:
 
     async def _fetch_agents(self) -> List[tuple]:
         """Fetch agents from Heidi server."""
-        import time
-
-        # Cache agents for 5 minutes
-        now = time.time()
-        if self._agents_cache and (now - self._agents_cache_time) < 300:
+        age = time.monotonic() - self._agents_cache_time
+        if self._agents_cache is not None and age < CACHE_STALE_TTL:
+            if age >= CACHE_TTL and not self._agents_lock.locked():
+                self._refresh_in_background(self._refresh_agents)
             return self._agents_cache
 
-        try:
-            url = f"{self.server_url}/agents"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self._get_headers(), timeout=10)
-            if response.status_code == 200:
-                agents_data = response.json()
-                self._agents_cache = [
-                    (a.get("name", "unknown"), a.get("description", "")) for a in agents_data
-                ]
-                self._agents_cache_time = now
-                return self._agents_cache
-        except Exception:
-            pass
+        agents = await self._refresh_agents()
+        if agents is not None:
+            return agents
 
         # Fallback to default agents
         return [
@@ -161,15 +266,86 @@ class Pipe:
             ("self-auditing", "Self-audits agent output before human review"),
         ]
 
+    async def _refresh_agents(self) -> Optional[List[tuple]]:
+        """GET /agents into the cache; returns None if the server gave nothing usable."""
+        async with self._agents_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if (
+                self._agents_cache is not None
+                and (time.monotonic() - self._agents_cache_time) < CACHE_TTL
+            ):
+                return self._agents_cache
+
+            try:
+                url = f"{self.server_url}/agents"
+                response = await self._get_http().get(url, headers=self._get_headers(), timeout=10)
+                if response.status_code == 200:
+                    agents_data = response.json()
+                    self._agents_cache = [
+                        (a.get("name", "unknown"), a.get("description", "")) for a in agents_data
+                    ]
+                    self._agents_cache_time = time.monotonic()
+                    return self._agents_cache
+            except Exception:
+                pass
+
+        return None
+
+    async def _warm_caches(self) -> tuple:
+        """Fetch models and agents concurrently so a cold start costs one round trip."""
+        return await asyncio.gather(self._fetch_models(), self._fetch_agents())
+
+    async def _fetch_opencode_models(self) -> List[str]:
+        """List OpenCode's OpenAI models, reusing the last result for OPENCODE_MODELS_TTL."""
+        now = time.monotonic()
+        if (
+            self._opencode_models_cache is not None
+            and (now - self._opencode_models_cache_time) < OPENCODE_MODELS_TTL
+        ):
+            return self._opencode_models_cache
+
+        opencode = _which("opencode")
+        if not opencode:
+            return []
+
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                opencode,
+                "models",
+                "openai",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+
+            async def read_models() -> List[str]:
+                names = []
+                async for raw in proc.stdout:
+                    name = raw.decode(errors="replace").strip()
+                    if name:
+                        names.append(name)
+                await proc.wait()
+                return names
+
+            names = await asyncio.wait_for(read_models(), timeout=30)
+            if proc.returncode == 0 and names:
+                self._opencode_models_cache = names
+                self._opencode_models_cache_time = now
+                return names
+        except Exception:
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+        return []
+
     async def pipes(self):
         """Return available models from Copilot, Jules, and OpenCode."""
-        import subprocess
-
         models = []
 
-        # Fetch Copilot models from server
+        # Fetch Copilot models from server (agents are warmed alongside)
         try:
-            copilot_models = await self._fetch_models()
+            copilot_models, _ = await self._warm_caches()
             for mid in copilot_models:
                 if mid and not mid.startswith("error"):
                     models.append(
@@ -194,32 +370,18 @@ class Pipe:
 
         # Fetch OpenCode models
         if self.valves.ENABLE_OPENCODE:
-            try:
-                result = await asyncio.to_thread(
-                    subprocess.run,
-                    ["opencode", "models", "openai"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+            for model_name in await self._fetch_opencode_models():
+                models.append(
+                    {
+                        "id": f"opencode/{model_name}",
+                        "name": f"OpenCode: {model_name}",
+                    }
                 )
-                if result.returncode == 0 and result.stdout.strip():
-                    for line in result.stdout.strip().split("\n"):
-                        model_name = line.strip()
-                        if model_name:
-                            models.append(
-                                {
-                                    "id": f"opencode/{model_name}",
-                                    "name": f"OpenCode: {model_name}",
-                                }
-                            )
-            except Exception:
-                pass
 
         # Add Ollama models if enabled
         if self.valves.ENABLE_OLLAMA:
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(f"{self.valves.OLLAMA_URL}/api/tags", timeout=10)
+                resp = await self._get_http().get(f"{self.valves.OLLAMA_URL}/api/tags", timeout=10)
                 if resp.status_code == 200:
                     data = resp.json()
                     for model in data.get("models", []):
@@ -245,7 +407,7 @@ class Pipe:
 
         return models
 
-    async def pipe(self, body: dict) -> Union[str, Generator, Iterator]:
+    async def pipe(self, body: dict) -> Union[str, Generator, Iterator, AsyncIterator]:
         """
         The main entry point for OpenWebUI Pipes (async).
         """
@@ -261,17 +423,11 @@ class Pipe:
 
             last_message = body["messages"][-1]["content"]
 
-            if last_message.startswith("loop:"):
-                task = last_message.replace("loop:", "").strip()
-                return await self.execute_loop(task, executor=executor, model=model)
-
-            if last_message.startswith("run:"):
-                prompt = last_message.replace("run:", "").strip()
-                return await self.execute_run(prompt, executor=executor, model=model)
-
-            if last_message.startswith("chat:"):
-                message = last_message.replace("chat:", "").strip()
-                return await self.chat_simple(message, executor=executor, model=model)
+            # "<command>: <text>" prefixes, resolved with a single partition
+            head, sep, rest = last_message.partition(":")
+            handler = self.PREFIX_COMMANDS.get(head) if sep else None
+            if handler:
+                return await getattr(self, handler)(rest.strip(), executor=executor, model=model)
 
             if last_message.startswith("agents"):
                 return await self.list_agents()
@@ -280,6 +436,8 @@ class Pipe:
                 return await self.list_runs()
 
             # Default: Orchestrated run
+            if self.valves.STREAM_RESPONSES:
+                return self.stream_orchestrated(body["messages"], executor=executor, model=model)
             return await self.chat_orchestrated(body["messages"], executor=executor, model=model)
 
         except Exception as e:
@@ -290,166 +448,130 @@ class Pipe:
         """List available agents."""
         agents = await self._fetch_agents()
 
-        output = "### 🤖 Available Agents\n\n"
-        output += "| Agent | Description |\n"
-        output += "|-------|-------------|\n"
-        for name, desc in agents:
-            output += f"| **{name}** | {desc} |\n"
+        rows = [f"| **{name}** | {desc} |" for name, desc in agents]
+        return AGENTS_TABLE_HEADER + "\n".join(rows) + "\n"
 
-        return output
+    @staticmethod
+    def _join_messages(messages: List[dict]) -> str:
+        """Flatten a chat history into a single prompt, one message per line."""
+        return "\n".join(m.get("content", "") for m in messages)
+
+    def _run_payload(self, prompt: str, executor: str, model: str) -> dict:
+        """Build a /run request body, leaving out the model for non-Copilot executors."""
+        payload = {"prompt": prompt, "executor": executor}
+        if executor == "copilot" and model:
+            payload["model"] = model
+        return payload
 
     def _handle_request_error(self, e: Exception, context: str = "Heidi Error") -> str:
         """Centralized error handling for requests."""
-        if isinstance(e, requests.exceptions.ConnectionError):
+        if isinstance(e, httpx.ConnectError):
             return f"**Connection Error**\n\nCould not connect to Heidi server at {self.server_url}\n\nEnsure `heidi serve` is running."
-        if isinstance(e, requests.exceptions.Timeout):
+        if isinstance(e, httpx.TimeoutException):
             return f"**Timeout Error**\n\nRequest timed out after {self.valves.REQUEST_TIMEOUT}s.\n\nTry increasing REQUEST_TIMEOUT valve."
-        if isinstance(e, requests.exceptions.HTTPError):
+        if isinstance(e, httpx.HTTPStatusError):
             if e.response.status_code == 401:
                 return "**Authentication Error**\n\n401 Unauthorized.\n\nEnsure HEIDI_API_KEY valve is set correctly."
             return f"**HTTP Error**\n\n{str(e)}\n"
 
         return f"**{context}**\n\n{str(e)}\n"
 
+    @heidi_http_errors("Heidi Loop Error")
     async def execute_loop(self, task: str, executor: str = None, model: str = None) -> str:
         """Execute a full agent loop (Plan → Runner → Audit)."""
         executor = executor or self.valves.DEFAULT_EXECUTOR
         model = model or self.valves.DEFAULT_MODEL
         url = f"{self.server_url}/loop"
-        payload = {
-            "task": task,
-            "executor": executor,
-            "max_retries": self.valves.MAX_RETRIES,
-            "model": model if executor == "copilot" else None,
-        }
-        payload = {k: v for k, v in payload.items() if v}
+        payload = {"task": task, "executor": executor}
+        if self.valves.MAX_RETRIES:
+            payload["max_retries"] = self.valves.MAX_RETRIES
+        if executor == "copilot" and model:
+            payload["model"] = model
+
+        response = await self._get_http().post(
+            url,
+            json=payload,
+            headers=self._get_headers(),
+            timeout=self.valves.REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        run_id = data.get("run_id", "unknown")
+        status = data.get("status", "unknown")
+        result = data.get("result", "")
+        error = data.get("error", "")
+
+        output = "### 🔄 Agent Loop Started\n"
+        output += f"**Task:** {task}\n"
+        output += f"**Executor:** {self.valves.DEFAULT_EXECUTOR}\n"
+        output += f"**Run ID:** {run_id}\n\n"
+
+        if status == "completed":
+            output += f"**Result:** {result}\n"
+            output += "\n[View full logs: `heidi runs`]\n"
+        else:
+            output += f"**Status:** {status}\n"
+            if error:
+                output += f"**Error:** {error}\n"
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=self.valves.REQUEST_TIMEOUT,
-                )
-            response.raise_for_status()
-            data = response.json()
-
-            run_id = data.get("run_id", "unknown")
-            status = data.get("status", "unknown")
-            result = data.get("result", "")
-            error = data.get("error", "")
-
-            output = "### 🔄 Agent Loop Started\n"
-            output += f"**Task:** {task}\n"
-            output += f"**Executor:** {self.valves.DEFAULT_EXECUTOR}\n"
-            output += f"**Run ID:** {run_id}\n\n"
-
-            if status == "completed":
-                output += f"**Result:** {result}\n"
-                output += "\n[View full logs: `heidi runs`]\n"
-            else:
-                output += f"**Status:** {status}\n"
-                if error:
-                    output += f"**Error:** {error}\n"
-
-            return output
-
-        except httpx.ConnectError:
-            return f"**Connection Error**\n\nCould not connect to Heidi server at {self.server_url}\n\nEnsure `heidi serve` is running."
-        except httpx.TimeoutException:
-            return f"**Timeout Error**\n\nRequest timed out after {self.valves.REQUEST_TIMEOUT}s.\n\nTry increasing REQUEST_TIMEOUT valve."
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "**Authentication Error**\n\n401 Unauthorized.\n\nEnsure HEIDI_API_KEY valve is set correctly."
-            return f"**HTTP Error**\n\n{str(e)}\n"
-        except Exception as e:
-            return self._handle_request_error(e, "Heidi Loop Error")
+        return output
 
+    @heidi_http_errors("Heidi Run Error")
     async def execute_run(self, prompt: str, executor: str = None, model: str = None) -> str:
         """Execute a single prompt with the specified executor."""
         executor = executor or self.valves.DEFAULT_EXECUTOR
         model = model or self.valves.DEFAULT_MODEL
         url = f"{self.server_url}/run"
-        payload = {
-            "prompt": prompt,
-            "executor": executor,
-            "model": model if executor == "copilot" else None,
-        }
-        payload = {k: v for k, v in payload.items() if v}
+        payload = self._run_payload(prompt, executor, model)
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=self.valves.REQUEST_TIMEOUT,
-                )
-            response.raise_for_status()
-            data = response.json()
-
-            run_id = data.get("run_id", "unknown")
-            status = data.get("status", "unknown")
-            result = data.get("result", "")
-            error = data.get("error", "")
-
-            output = "### ▶️ Run Started\n"
-            output += f"**Prompt:** {prompt[:100]}...\n"
-            output += f"**Executor:** {self.valves.DEFAULT_EXECUTOR}\n"
-            output += f"**Run ID:** {run_id}\n\n"
-
-            if status == "completed":
-                output += f"**Output:**\n\n{result}\n"
-            else:
-                output += f"**Status:** {status}\n"
-                if error:
-                    output += f"**Error:** {error}\n"
-
-            return output
-
-            return output
+        response = await self._get_http().post(
+            url,
+            json=payload,
+            headers=self._get_headers(),
+            timeout=self.valves.REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        run_id = data.get("run_id", "unknown")
+        status = data.get("status", "unknown")
+        result = data.get("result", "")
+        error = data.get("error", "")
+
+        output = "### ▶️ Run Started\n"
+        output += f"**Prompt:** {prompt[:100]}...\n"
+        output += f"**Executor:** {self.valves.DEFAULT_EXECUTOR}\n"
+        output += f"**Run ID:** {run_id}\n\n"
+
+        if status == "completed":
+            output += f"**Output:**\n\n{result}\n"
+        else:
+            output += f"**Status:** {status}\n"
+            if error:
+                output += f"**Error:** {error}\n"
 
-        except httpx.ConnectError:
-            return f"**Connection Error**\n\nCould not connect to Heidi server at {self.server_url}\n\nEnsure `heidi serve` is running."
-        except httpx.TimeoutException:
-            return f"**Timeout Error**\n\nRequest timed out after {self.valves.REQUEST_TIMEOUT}s."
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "**Authentication Error**\n\n401 Unauthorized.\n\nEnsure HEIDI_API_KEY valve is set correctly."
-            return f"**HTTP Error**\n\n{str(e)}\n"
-        except Exception as e:
-            return self._handle_request_error(e, "Heidi Run Error")
+        return output
 
+    @heidi_http_errors("Error listing runs")
     async def list_runs(self) -> str:
         """List recent runs."""
         url = f"{self.server_url}/runs"
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self._get_headers(), timeout=10)
-            response.raise_for_status()
-            runs = response.json()
+        response = await self._get_http().get(url, headers=self._get_headers(), timeout=10)
+        response.raise_for_status()
+        runs = response.json()
 
-            if not runs:
-                return "### 📋 Recent Runs\n\nNo runs found."
+        if not runs:
+            return "### 📋 Recent Runs\n\nNo runs found."
 
-            output = "### 📋 Recent Runs\n\n"
-            output += "| Run ID | Status | Task |\n"
-            output += "|--------|--------|------|\n"
-            for run in runs[:10]:
-                task = run.get("task", run.get("prompt", ""))[:40]
-                status = run.get("status", "unknown")
-                output += f"| {run.get('run_id', 'N/A')} | {status} | {task}... |\n"
-
-            return output
-
-            return output
-
-        except httpx.HTTPStatusError as e:
-            return self._handle_request_error(e, "Error listing runs")
-        except Exception as e:
-            return self._handle_request_error(e, "Error listing runs")
+        rows = [
+            f"| {run.get('run_id', 'N/A')} | {run.get('status', 'unknown')} "
+            f"| {run.get('task', run.get('prompt', ''))[:40]}... |"
+            for run in runs[:10]
+        ]
+        return RUNS_TABLE_HEADER + "\n".join(rows) + "\n"
 
+    @heidi_http_errors("Heidi Chat Error")
     async def chat_simple(self, message: str, executor: str = None, model: str = None) -> str:
         """Execute simple chat (no artifacts)."""
         executor = executor or self.valves.DEFAULT_EXECUTOR
@@ -462,67 +584,187 @@ class Pipe:
             "executor": executor,
         }
 
-        try:
-            response = requests.post(
-                url, json=payload, headers=self._get_headers(), timeout=self.valves.REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response", "[No response]")
-
-        except requests.exceptions.ConnectionError:
-            return f"**Connection Error**\n\nCould not connect to Heidi server at {self.server_url}\n\nEnsure `heidi serve` is running."
-        except requests.exceptions.Timeout:
-            return f"**Timeout Error**\n\nRequest timed out after {self.valves.REQUEST_TIMEOUT}s."
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                return "**Authentication Error**\n\n401 Unauthorized.\n\nEnsure HEIDI_API_KEY valve is set correctly."
-            return f"**HTTP Error**\n\n{str(e)}\n"
-        except Exception as e:
-            return f"**Heidi Chat Error**\n\n{str(e)}\n"
+        response = await self._get_http().post(
+            url,
+            json=payload,
+            headers=self._get_headers(),
+            timeout=self.valves.REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("response", "[No response]")
 
+    @heidi_http_errors("Heidi Chat Error")
     async def chat_orchestrated(
         self, messages: List[dict], executor: str = None, model: str = None
     ) -> str:
         """Route chat messages to Copilot via Heidi (Orchestrated Run)."""
         executor = executor or self.valves.DEFAULT_EXECUTOR
         model = model or self.valves.DEFAULT_MODEL
-        prompt = "\n".join([m.get("content", "") for m in messages])
+        prompt = self._join_messages(messages)
 
-        url = f"{self.server_url}/run"
-        payload = {
-            "prompt": prompt,
-            "executor": executor,
-            "model": model if executor == "copilot" else None,
-        }
-        payload = {k: v for k, v in payload.items() if v}
+        payload = self._run_payload(prompt, executor, model)
+
+        data = await self._submit_run(payload)
+
+        if data.get("status") == "completed":
+            return data.get("result", "[No response]")
+        else:
+            return f"**Error:** {data.get('error', 'Unknown error')}\n"
+
+    async def stream_orchestrated(
+        self, messages: List[dict], executor: str = None, model: str = None
+    ) -> AsyncIterator[str]:
+        """Like chat_orchestrated, but yield output from /run as SSE frames arrive."""
+        executor = executor or self.valves.DEFAULT_EXECUTOR
+        model = model or self.valves.DEFAULT_MODEL
+        prompt = self._join_messages(messages)
+
+        payload = self._run_payload(prompt, executor, model)
+        headers = {**self._get_headers(), "Accept": "text/event-stream"}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
+            async with self._get_http().stream(
+                "POST",
+                f"{self.server_url}/run",
+                json=payload,
+                headers=headers,
+                timeout=self.valves.REQUEST_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+
+                if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                    # Server does not stream; fall back to its buffered JSON result
+                    await response.aread()
+                    data = response.json()
+                    if data.get("status") == "completed":
+                        yield data.get("result", "[No response]")
+                    else:
+                        yield f"**Error:** {data.get('error', 'Unknown error')}\n"
+                    return
+
+                event_lines = []
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        event_lines.append(line[6:] if line.startswith("data: ") else line[5:])
+                    elif not line and event_lines:
+                        data = "\n".join(event_lines)
+                        event_lines = []
+                        if data == "[DONE]":
+                            return
+                        yield data
+                if event_lines and event_lines != ["[DONE]"]:
+                    yield "\n".join(event_lines)
+
+        except Exception as e:
+            yield self._handle_request_error(e, "Heidi Chat Error")
+
+    async def _post_run(self, payload: dict) -> dict:
+        """POST a single prompt to /run and return the decoded response."""
+        response = await self._get_http().post(
+            f"{self.server_url}/run",
+            json=payload,
+            headers=self._get_headers(),
+            timeout=self.valves.REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _submit_run(self, payload: dict) -> dict:
+        """Queue a /run payload for micro-batching and wait for its result."""
+        if not self._batch_supported:
+            return await self._post_run(payload)
+
+        if self._batch_flusher is None or self._batch_flusher.done():
+            self._batch_queue = asyncio.Queue()
+            self._batch_flusher = asyncio.create_task(self._flush_batches())
+
+        future = asyncio.get_running_loop().create_future()
+        self._batch_futures.add(future)
+        future.add_done_callback(self._batch_futures.discard)
+        await self._batch_queue.put((payload, future))
+        return await future
+
+    async def _flush_batches(self):
+        """Drain the queue in windows of BATCH_WINDOW seconds or MAX_BATCH items."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _dispatch_batch(self, batch: List[tuple]):
+        """Send queued prompts as one /batch request per executor/model pair."""
+        groups = {}
+        for payload, future in batch:
+            key = (payload.get("executor"), payload.get("model"))
+            groups.setdefault(key, []).append((payload, future))
+
+        # Groups are independent, so one slow executor must not hold up the others
+        await asyncio.gather(
+            *(self._dispatch_group(executor, model, items)
+              for (executor, model), items in groups.items())
+        )
+
+    async def _dispatch_group(self, executor: str, model: str, items: List[tuple]):
+        """Resolve one executor/model group via /batch, or /run per prompt."""
+        if len(items) > 1 and self._batch_supported:
+            body = {"prompts": [p["prompt"] for p, _ in items], "executor": executor}
+            if model:
+                body["model"] = model
+            try:
+                response = await self._get_http().post(
+                    f"{self.server_url}/batch",
+                    json=body,
                     headers=self._get_headers(),
                     timeout=self.valves.REQUEST_TIMEOUT,
                 )
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("status") == "completed":
-                return data.get("result", "[No response]")
-            else:
-                return f"**Error:** {data.get('error', 'Unknown error')}\n"
-
-        except httpx.ConnectError:
-            return f"**Connection Error**\n\nCould not connect to Heidi server at {self.server_url}\n\nEnsure `heidi serve` is running."
-        except httpx.TimeoutException:
-            return f"**Timeout Error**\n\nRequest timed out after {self.valves.REQUEST_TIMEOUT}s."
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "**Authentication Error**\n\n401 Unauthorized.\n\nEnsure HEIDI_API_KEY valve is set correctly."
-            return f"**HTTP Error**\n\n{str(e)}\n"
+                if response.status_code in (404, 405):
+                    # Server predates /batch; stop trying and fall back to /run
+                    self._batch_supported = False
+                else:
+                    response.raise_for_status()
+                    data = response.json()
+                    results = data.get("results", []) if isinstance(data, dict) else data
+                    if len(results) != len(items):
+                        # The server already ran these prompts; resending them via /run
+                        # would execute every one a second time
+                        raise RuntimeError(
+                            f"/batch returned {len(results)} results for {len(items)} prompts"
+                        )
+                    for (_, future), result in zip(items, results):
+                        if not future.done():
+                            future.set_result(result)
+                    return
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        await asyncio.gather(*(self._resolve_single(p, f) for p, f in items))
+
+    async def _resolve_single(self, payload: dict, future: asyncio.Future):
+        """Run one queued payload through /run and resolve its future."""
+        try:
+            result = await self._post_run(payload)
         except Exception as e:
-            return self._handle_request_error(e, "Heidi Chat Error")
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
 
 
 # For backward compatibility with old client